@@ -37,8 +37,8 @@ def _ensure_tests_required_column(conn: sqlite3.Connection) -> None:
     if cursor.fetchone() is None:
         return
 
-    cursor.execute("PRAGMA table_info(tasks)")
-    columns = {row["name"] for row in cursor.fetchall()}
+    # Column 1 of PRAGMA table_info is the name; stream rows positionally
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(tasks)")}
     if "tests_required" in columns:
         return
 
@@ -239,6 +239,125 @@ class TaskRepository:
             except sqlite3.IntegrityError as e:
                 raise ValueError(f"Task with name '{name}' already exists") from e
 
+    @staticmethod
+    def add_tasks_bulk(tasks: List[dict]) -> List[TaskResponse]:
+        """
+        Add several tasks in a single transaction.
+
+        Each entry takes the same keys as add_task's arguments. All rows are
+        inserted with one executemany call and a single commit, and the
+        snapshot is exported once.
+
+        Args:
+            tasks: Task definitions with name, description and specification,
+                plus optional priority, status, feature_name and tests_required
+
+        Returns:
+            List of TaskResponse models in the same order as the input
+
+        Raises:
+            ValueError: If a task name already exists or a feature doesn't exist
+        """
+        if not tasks:
+            return []
+
+        rows = []
+        for task in tasks:
+            validate_specification(task["specification"])
+            rows.append(
+                (
+                    task["name"],
+                    task["description"],
+                    task["specification"],
+                    int(task.get("tests_required", True)),
+                    task.get("priority", 0),
+                    task.get("status", "pending"),
+                    task.get("feature_name", "misc"),
+                )
+            )
+        feature_names = sorted({row[-1] for row in rows})
+
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+
+            placeholders = ", ".join("?" for _ in feature_names)
+            cursor.execute(
+                f"SELECT name FROM features WHERE name IN ({placeholders})",
+                feature_names,
+            )
+            existing = {row["name"] for row in cursor.fetchall()}
+            for feature_name in feature_names:
+                if feature_name not in existing:
+                    raise ValueError(f"Feature '{feature_name}' does not exist")
+
+            # Names are unique per feature, so look up every (name, feature)
+            # pair at once and report the first clash the way add_task does
+            names = sorted({row[0] for row in rows})
+            placeholders = ", ".join("?" for _ in names)
+            cursor.execute(
+                f"""
+                SELECT t.name, f.name AS feature_name
+                FROM tasks t
+                JOIN features f ON t.feature_id = f.id
+                WHERE t.name IN ({placeholders})
+                """,
+                names,
+            )
+            taken = {(row["name"], row["feature_name"]) for row in cursor.fetchall()}
+            for row in rows:
+                key = (row[0], row[-1])
+                if key in taken:
+                    raise ValueError(f"Task with name '{row[0]}' already exists")
+                taken.add(key)
+
+            try:
+                cursor.executemany(
+                    """
+                    INSERT INTO tasks (
+                        feature_id,
+                        name,
+                        description,
+                        specification,
+                        tests_required,
+                        priority,
+                        status
+                    )
+                    SELECT
+                        f.id,
+                        ?,
+                        ?,
+                        ?,
+                        ?,
+                        ?,
+                        ?
+                    FROM features f
+                    WHERE f.name = ?
+                    """,
+                    rows,
+                )
+                conn.commit()
+            except sqlite3.IntegrityError as e:
+                raise ValueError(f"Failed to add tasks: {e}") from e
+
+            _trigger_snapshot_export()
+
+            cursor.execute(
+                f"""
+                SELECT t.*, f.name AS feature_name
+                FROM tasks t
+                JOIN features f ON t.feature_id = f.id
+                WHERE t.name IN ({placeholders})
+                """,
+                names,
+            )
+            created = {
+                (row["name"], row["feature_name"]): TaskResponse.from_dict(
+                    {key: row[key] for key in row.keys()}
+                )
+                for row in cursor.fetchall()
+            }
+            return [created[(row[0], row[-1])] for row in rows]
+
     @staticmethod
     def update_task(
         name: str,
@@ -518,6 +637,71 @@ class DependencyRepository:
                     raise ValueError("Circular dependencies are not allowed") from e
                 raise ValueError("Dependency already exists") from e
 
+    @staticmethod
+    def add_dependencies_bulk(
+        dependencies: List[tuple[str, str]],
+    ) -> List[DependencyResponse]:
+        """
+        Add several dependency relationships in a single transaction.
+
+        Args:
+            dependencies: (task_name, depends_on_task_name) pairs
+
+        Returns:
+            List of DependencyResponse models in the same order as the input
+
+        Raises:
+            ValueError: If a task doesn't exist, a dependency already exists,
+                or a dependency would create a cycle
+        """
+        if not dependencies:
+            return []
+
+        names = sorted({name for pair in dependencies for name in pair})
+
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+
+            placeholders = ", ".join("?" for _ in names)
+            cursor.execute(
+                f"SELECT name, id FROM tasks WHERE name IN ({placeholders})",
+                names,
+            )
+            task_ids = {row["name"]: row["id"] for row in cursor.fetchall()}
+            missing = [name for name in names if name not in task_ids]
+            if missing:
+                raise ValueError(
+                    "Both tasks must exist to create a dependency: "
+                    + ", ".join(missing)
+                )
+
+            try:
+                cursor.executemany(
+                    """
+                    INSERT INTO dependencies (task_id, depends_on_task_id)
+                    VALUES (?, ?)
+                    """,
+                    [
+                        (task_ids[task_name], task_ids[depends_on_task_name])
+                        for task_name, depends_on_task_name in dependencies
+                    ],
+                )
+                conn.commit()
+            except sqlite3.IntegrityError as e:
+                if "circular" in str(e).lower():
+                    raise ValueError("Circular dependencies are not allowed") from e
+                raise ValueError("Dependency already exists") from e
+
+            _trigger_snapshot_export()
+
+            return [
+                DependencyResponse(
+                    task_name=task_name,
+                    depends_on_task_name=depends_on_task_name,
+                )
+                for task_name, depends_on_task_name in dependencies
+            ]
+
     @staticmethod
     def remove_dependency(task_name: str, depends_on_task_name: str) -> bool:
         """Remove a dependency relationship."""
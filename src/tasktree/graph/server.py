@@ -18,7 +18,7 @@ import hashlib
 import json
 from importlib.resources import files
 import sqlite3
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from urllib.parse import unquote, urlparse
 
@@ -26,6 +26,10 @@ from urllib.parse import unquote, urlparse
 class GraphAPIHandler(BaseHTTPRequestHandler):
     """HTTP request handler for the graph API."""
 
+    # Keep connections open between requests; every response sets
+    # Content-Length, and ThreadingHTTPServer gives each connection a thread
+    protocol_version = "HTTP/1.1"
+
     db_path: Path
     assets_dir = files("tasktree.graph.assets.graph_assets")
 
@@ -282,10 +286,12 @@ class GraphAPIHandler(BaseHTTPRequestHandler):
             safe_path.suffix.lower(), "application/octet-stream"
         )
 
+        body = asset_path.read_bytes()
         self.send_response(200)
         self.send_header("Content-type", content_type)
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(asset_path.read_bytes())
+        self.wfile.write(body)
 
     def _get_graph_json(self) -> dict:
         """
@@ -379,32 +385,61 @@ class GraphAPIHandler(BaseHTTPRequestHandler):
 
     def _send_json_response(self, status_code: int, data: dict) -> None:
         """Send JSON response with appropriate headers."""
+        body = json.dumps(data, indent=2).encode()
         self.send_response(status_code)
         self.send_header("Content-type", "application/json")
         self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(json.dumps(data, indent=2).encode())
+        self.wfile.write(body)
 
     def _send_html_response(self, status_code: int, html: str) -> None:
         """Send HTML response with appropriate headers."""
+        body = html.encode()
         self.send_response(status_code)
         self.send_header("Content-type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(html.encode())
+        self.wfile.write(body)
 
     def _send_error(self, status_code: int, message: str) -> None:
         """Send error response as JSON."""
+        error_data = {"error": message, "status": status_code}
+        body = json.dumps(error_data, indent=2).encode()
         self.send_response(status_code)
         self.send_header("Content-type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        error_data = {"error": message, "status": status_code}
-        self.wfile.write(json.dumps(error_data, indent=2).encode())
+        self.wfile.write(body)
 
     def log_message(self, format: str, *args) -> None:
         """Silence standard logging of requests."""
         pass
 
 
+def create_server(port: int, db_path: Path) -> ThreadingHTTPServer:
+    """
+    Bind the graph API server without starting to serve.
+
+    The socket is bound and listening on return, so passing port 0 lets the
+    OS pick a free port that callers read back from server_address.
+
+    Args:
+        port: Port number to listen on, or 0 for any free port
+        db_path: Path to the SQLite database file
+
+    Returns:
+        The bound server; call serve_forever() to handle requests
+    """
+    # Set the db_path as a class variable so the handler can access it
+    GraphAPIHandler.db_path = db_path
+
+    # Serve each connection on its own thread so a slow or idle client
+    # (the viewer polls every few seconds) never blocks other requests
+    server_address = ("", port)
+    return ThreadingHTTPServer(server_address, GraphAPIHandler)
+
+
 def run_server(port: int, db_path: Path) -> None:
     """
     Start the HTTP server.
@@ -419,11 +454,7 @@ def run_server(port: int, db_path: Path) -> None:
         print("Run 'task init-db' to create the database.")
         return
 
-    # Set the db_path as a class variable so the handler can access it
-    GraphAPIHandler.db_path = db_path
-
-    server_address = ("", port)
-    httpd = HTTPServer(server_address, GraphAPIHandler)
+    httpd = create_server(port, db_path)
 
     print("TaskTree Graph API Server")
     print(f"Database: {db_path}")
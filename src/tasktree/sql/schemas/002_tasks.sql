@@ -26,6 +26,10 @@ CREATE TABLE IF NOT EXISTS tasks (
   UNIQUE(name, feature_id)
 );
 
+-- Serves v_available_tasks: filter on status, then order by priority/created_at
+CREATE INDEX IF NOT EXISTS idx_tasks_status_priority
+ON tasks(status, priority DESC, created_at);
+
 -- Triggers to automatically set timestamps based on status changes
 
 -- Trigger to set started_at when status becomes 'in_progress'
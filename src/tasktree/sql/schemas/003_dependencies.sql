@@ -4,7 +4,12 @@ CREATE TABLE IF NOT EXISTS dependencies (
   depends_on_task_id TEXT NOT NULL REFERENCES tasks(id) ON DELETE CASCADE,
   PRIMARY KEY (task_id, depends_on_task_id),
   CHECK (task_id != depends_on_task_id) -- Prevent self-dependencies
-);
+) WITHOUT ROWID; -- Rows are just the key, so store them in the primary key B-tree
+
+-- The primary key covers lookups by task_id; this covers the reverse direction
+-- (dependents of a task, and ON DELETE CASCADE from depends_on_task_id)
+CREATE INDEX IF NOT EXISTS idx_dependencies_depends_on
+ON dependencies(depends_on_task_id);
 
 -- Trigger to prevent circular dependencies
 CREATE TRIGGER IF NOT EXISTS prevent_circular_dependencies
@@ -14,15 +14,4 @@ WHERE t.status = 'pending'  -- Only tasks that are pending
     WHERE d.task_id = t.id
       AND dep_task.status != 'completed'
   )
-  AND (
-    -- Include tasks with no dependencies
-    NOT EXISTS (
-      SELECT 1 FROM dependencies d WHERE d.task_id = t.id
-    )
-    OR
-    -- Or tasks that exist in dependencies table
-    EXISTS (
-      SELECT 1 FROM dependencies d WHERE d.task_id = t.id
-    )
-  )
 ORDER BY t.priority DESC, t.created_at ASC;
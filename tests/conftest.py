@@ -2,6 +2,8 @@
 Pytest configuration and fixtures for tasktree tests.
 """
 
+import os
+import shutil
 import sqlite3
 import tempfile
 from contextlib import contextmanager
@@ -12,9 +14,48 @@ import pytest
 
 from tasktree.db.init import initialize_database
 
+TMPFS_DIR = "/dev/shm"
+TMPFS_MIN_FREE_BYTES = 256 * 1024 * 1024
+SNAPSHOT_FILENAME = "tasktree.io.snapshot.jsonl"
+
+_TMPFS_BASETEMP = pytest.StashKey[str]()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Keep pytest's temporary directories on tmpfs when it is available.
+
+    Only tmp_path and tmp_path_factory are redirected, by giving pytest a
+    fresh --basetemp under /dev/shm; tempfile.gettempdir() is left alone so
+    the code under test keeps writing wherever it normally would. This runs
+    first so the basetemp is in place before pytest builds its temp path
+    factory. It is skipped when --basetemp or TMPDIR is set, or when
+    /dev/shm is missing, read-only or low on space (containers often cap it
+    at 64 MB). xdist workers inherit a --basetemp from the controller, so
+    they skip it too.
+    """
+    if config.option.basetemp or os.environ.get("TMPDIR"):
+        return
+    if not (os.path.isdir(TMPFS_DIR) and os.access(TMPFS_DIR, os.W_OK)):
+        return
+    if shutil.disk_usage(TMPFS_DIR).free < TMPFS_MIN_FREE_BYTES:
+        return
+
+    basetemp = tempfile.mkdtemp(prefix="tasktree-pytest-", dir=TMPFS_DIR)
+    config.option.basetemp = basetemp
+    config.stash[_TMPFS_BASETEMP] = basetemp
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Remove the tmpfs basetemp created in pytest_configure, if any."""
+    basetemp = config.stash.get(_TMPFS_BASETEMP, None)
+    if basetemp is not None:
+        shutil.rmtree(basetemp, ignore_errors=True)
+
 
 @pytest.fixture(scope="session")
-def test_db() -> Generator[Path, None, None]:
+def test_db(tmp_path_factory: pytest.TempPathFactory) -> Generator[Path, None, None]:
     """
     Create a temporary test database with schema and views for the session.
 
@@ -25,13 +66,13 @@ def test_db() -> Generator[Path, None, None]:
     4. Provides a shared database for the test session
     5. Automatically cleans up after the test session
 
+    The file lives under tmp_path_factory, which gives every pytest-xdist
+    worker its own base directory, so parallel sessions never share a file.
+
     Yields:
         Path: Path to the temporary test database file
     """
-    # Create a temporary database file
-    temp_db = tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".db")
-    db_path = Path(temp_db.name)
-    temp_db.close()
+    db_path = tmp_path_factory.mktemp("db") / "test.db"
 
     try:
         # Initialize database using bundled SQL assets
@@ -46,12 +87,68 @@ def test_db() -> Generator[Path, None, None]:
             db_path.unlink()
 
 
+@pytest.fixture(scope="session")
+def _template_db(test_db: Path) -> Generator[sqlite3.Connection, None, None]:
+    """
+    Load the session test database into an in-memory template.
+
+    The schema and views are applied once, by test_db. Each test then gets
+    its own copy of this template through the backup API, which copies the
+    page image instead of replaying the DDL.
+
+    Yields:
+        sqlite3.Connection: Connection holding the in-memory template
+    """
+    template = sqlite3.connect(":memory:", check_same_thread=False)
+    source = sqlite3.connect(test_db)
+    try:
+        source.backup(template)
+    finally:
+        source.close()
+
+    try:
+        yield template
+    finally:
+        template.close()
+
+
+@pytest.fixture(scope="session")
+def table_columns(_template_db: sqlite3.Connection) -> dict[str, dict[str, int]]:
+    """
+    Read the column layout of every table in the template once per session.
+
+    Returns:
+        dict: Table name mapped to {column name: primary key position}
+    """
+    tables = [
+        row[0]
+        for row in _template_db.execute(
+            "SELECT name FROM sqlite_master WHERE type='table'"
+        )
+    ]
+    return {
+        table: {
+            row[1]: row[5]
+            for row in _template_db.execute(f"PRAGMA table_info({table})")
+        }
+        for table in tables
+    }
+
+
+def _connect(database, **kwargs) -> sqlite3.Connection:
+    """Open a connection with the Row factory and foreign keys enabled."""
+    conn = sqlite3.connect(database, **kwargs)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    return conn
+
+
 class _ConnectionProxy:
     def __init__(self, conn: sqlite3.Connection) -> None:
         self._conn = conn
 
     def commit(self) -> None:
-        """No-op commit to keep transaction open for rollback."""
+        """No-op commit; the per-test copy is discarded anyway."""
 
     def __getattr__(self, name: str):
         return getattr(self._conn, name)
@@ -64,20 +161,30 @@ class _SharedConnectionProxy(_ConnectionProxy):
 
 
 @pytest.fixture(scope="function", autouse=True)
-def _db_transaction(test_db: Path, monkeypatch) -> Iterator[None]:
+def _isolated_db(
+    request: pytest.FixtureRequest,
+    test_db: Path,
+    _template_db: sqlite3.Connection,
+    monkeypatch,
+) -> Iterator[None]:
     """
-    Wrap each test in a transaction and roll back after.
+    Give each test a fresh in-memory copy of the template database.
 
     This fixture monkeypatches tasktree.core.database.get_db_connection to
-    always return the same connection (with commits disabled), so tests are
-    isolated via rollback while using a session-scoped database.
+    always return the same connection, points DB_PATH at test_db, sends
+    snapshot exports to a file beside it through TASKTREE_SNAPSHOT_PATH, and
+    redirects every sqlite3.connect call for the test_db path to it. The copy
+    is discarded after the test, so tests start from the same state even if
+    something commits. Tests marked ``no_db`` skip all of this.
     """
+    if request.node.get_closest_marker("no_db") is not None:
+        yield
+        return
+
     import tasktree.core.database as db_module
 
-    conn = sqlite3.connect(test_db, check_same_thread=False)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
-    conn.execute("BEGIN")
+    conn = _connect(":memory:", check_same_thread=False, cached_statements=256)
+    _template_db.backup(conn)
 
     proxy = _ConnectionProxy(conn)
     shared_proxy = _SharedConnectionProxy(conn)
@@ -99,13 +206,18 @@ def _db_transaction(test_db: Path, monkeypatch) -> Iterator[None]:
     def _get_db_connection() -> Iterator[_ConnectionProxy]:
         yield proxy
 
+    monkeypatch.setattr(db_module, "DB_PATH", test_db)
+    # Snapshot exports resolve their path per call, so the environment
+    # override keeps them next to the session database instead of in the repo
+    monkeypatch.setenv(
+        "TASKTREE_SNAPSHOT_PATH", str(test_db.with_name(SNAPSHOT_FILENAME))
+    )
     monkeypatch.setattr(db_module, "get_db_connection", _get_db_connection)
     monkeypatch.setattr(sqlite3, "connect", _shared_connect)
 
     try:
         yield
     finally:
-        conn.rollback()
         conn.close()
 
 
@@ -115,7 +227,10 @@ def test_db_connection(test_db: Path) -> Generator[sqlite3.Connection, None, Non
     Provide a database connection to the test database.
 
     This fixture depends on the test_db fixture and provides
-    a ready-to-use connection with row_factory set.
+    a ready-to-use connection with row_factory set. It resolves to the
+    per-test connection, which _isolated_db already configured, and whose
+    statement cache is enlarged so repeated conn.execute() calls with the
+    same SQL string skip re-parsing.
 
     Args:
         test_db: Path to the test database (from test_db fixture)
@@ -124,9 +239,6 @@ def test_db_connection(test_db: Path) -> Generator[sqlite3.Connection, None, Non
         sqlite3.Connection: Active database connection
     """
     conn = sqlite3.connect(test_db)
-    conn.row_factory = sqlite3.Row
-    # Enable foreign key constraints
-    conn.execute("PRAGMA foreign_keys = ON")
 
     try:
         yield conn
@@ -148,10 +260,7 @@ def get_test_db_connection(db_path: Path):
     Yields:
         sqlite3.Connection: Database connection
     """
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    # Enable foreign key constraints
-    conn.execute("PRAGMA foreign_keys = ON")
+    conn = _connect(db_path)
     try:
         yield conn
     finally:
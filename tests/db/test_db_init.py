@@ -17,6 +17,20 @@ from tasktree.db.init import (
 )
 
 
+def _fast_test_connect(db_path: Path) -> sqlite3.Connection:
+    """
+    Connect to a throwaway test database without durability guarantees.
+
+    The rollback journal is kept in memory and fsyncs are skipped, so the
+    commits issued by apply_schemas/apply_views do not hit the disk twice.
+    """
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode = MEMORY")
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    return conn
+
+
 def test_get_sql_files_schemas():
     """Test getting schema SQL files from bundled resources."""
     files = get_sql_files("tasktree.sql.schemas")
@@ -57,7 +71,7 @@ def test_apply_schemas():
     temp_db.close()
 
     try:
-        conn = sqlite3.connect(db_path)
+        conn = _fast_test_connect(db_path)
         conn.execute("PRAGMA foreign_keys = ON")
 
         # Apply schemas
@@ -89,7 +103,7 @@ def test_apply_views():
     temp_db.close()
 
     try:
-        conn = sqlite3.connect(db_path)
+        conn = _fast_test_connect(db_path)
         conn.execute("PRAGMA foreign_keys = ON")
 
         # Apply schemas first
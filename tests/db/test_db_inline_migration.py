@@ -0,0 +1,90 @@
+"""
+Tests for the inline tests_required migration on legacy databases.
+"""
+
+import sqlite3
+from collections.abc import Iterator
+
+import pytest
+
+from tasktree.core.database import _ensure_tests_required_column
+
+pytestmark = pytest.mark.no_db
+
+LEGACY_SCHEMA = """
+CREATE TABLE tasks (
+  id CHAR(32) PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
+  feature_id CHAR(32) NOT NULL,
+  name VARCHAR(55) NOT NULL,
+  description TEXT NOT NULL,
+  specification TEXT NOT NULL,
+  priority INTEGER DEFAULT 0,
+  status TEXT DEFAULT 'pending'
+);
+
+INSERT INTO tasks (feature_id, name, description, specification)
+VALUES ('misc', 'legacy-task', 'Legacy task', 'Legacy spec');
+"""
+
+
+@pytest.fixture(scope="module")
+def legacy_template() -> Iterator[sqlite3.Connection]:
+    """
+    Build the pre-tests_required schema once for the module.
+
+    Yields:
+        sqlite3.Connection: In-memory database holding the legacy schema
+    """
+    template = sqlite3.connect(":memory:")
+    template.executescript(LEGACY_SCHEMA)
+
+    try:
+        yield template
+    finally:
+        template.close()
+
+
+@pytest.fixture
+def legacy_conn(
+    legacy_template: sqlite3.Connection,
+) -> Iterator[sqlite3.Connection]:
+    """
+    Provide a fresh copy of the legacy database for a single test.
+
+    Yields:
+        sqlite3.Connection: Connection to the copied legacy database
+    """
+    conn = sqlite3.connect(":memory:")
+    legacy_template.backup(conn)
+    conn.row_factory = sqlite3.Row
+
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def _task_columns(conn: sqlite3.Connection) -> set[str]:
+    return {row[1] for row in conn.execute("PRAGMA table_info(tasks)")}
+
+
+def test_inline_migration_adds_tests_required_column(legacy_conn):
+    """Test that a legacy tasks table gains tests_required defaulting to 1."""
+    assert "tests_required" not in _task_columns(legacy_conn)
+
+    _ensure_tests_required_column(legacy_conn)
+
+    assert "tests_required" in _task_columns(legacy_conn)
+    row = legacy_conn.execute(
+        "SELECT tests_required FROM tasks WHERE name = 'legacy-task'"
+    ).fetchone()
+    assert row["tests_required"] == 1
+
+
+def test_inline_migration_is_idempotent(legacy_conn):
+    """Test that running the migration twice leaves the table unchanged."""
+    _ensure_tests_required_column(legacy_conn)
+    _ensure_tests_required_column(legacy_conn)
+
+    columns = [row[1] for row in legacy_conn.execute("PRAGMA table_info(tasks)")]
+    assert columns.count("tests_required") == 1
@@ -2,28 +2,12 @@
 Tests for the add_dependency tool including circular dependency prevention.
 """
 
-from pathlib import Path
-
 import pytest
 
 from tasktree.core.database import DependencyRepository, TaskRepository
 
 
-@pytest.fixture
-def mock_db_path(test_db: Path, monkeypatch):
-    """
-    Mock the DB_PATH to use the test database.
-
-    This fixture modifies the database.DB_PATH to point to the test database,
-    ensuring all repository operations use the isolated test database.
-    """
-    import tasktree.core.database as db_module
-
-    monkeypatch.setattr(db_module, "DB_PATH", test_db)
-    return test_db
-
-
-def test_add_dependency_basic(mock_db_path):
+def test_add_dependency_basic():
     """Test adding a basic dependency between two tasks."""
     # Create two tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -36,7 +20,7 @@ def test_add_dependency_basic(mock_db_path):
     assert dep.depends_on_task_name == "task-a"
 
 
-def test_add_dependency_multiple_dependencies_single_task(mock_db_path):
+def test_add_dependency_multiple_dependencies_single_task():
     """Test adding multiple dependencies for a single task."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -57,7 +41,7 @@ def test_add_dependency_multiple_dependencies_single_task(mock_db_path):
     assert len(deps) == 2
 
 
-def test_add_dependency_chain(mock_db_path):
+def test_add_dependency_chain():
     """Test creating a dependency chain (A -> B -> C)."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -73,7 +57,7 @@ def test_add_dependency_chain(mock_db_path):
     assert len(all_deps) == 2
 
 
-def test_add_dependency_nonexistent_task(mock_db_path):
+def test_add_dependency_nonexistent_task():
     """Test that adding dependency with non-existent task raises error."""
     # Create only one task
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -83,7 +67,7 @@ def test_add_dependency_nonexistent_task(mock_db_path):
         DependencyRepository.add_dependency("task-a", "nonexistent-task")
 
 
-def test_add_dependency_both_tasks_nonexistent(mock_db_path):
+def test_add_dependency_both_tasks_nonexistent():
     """Test that adding dependency with both tasks non-existent raises error."""
     # Don't create any tasks
 
@@ -92,7 +76,7 @@ def test_add_dependency_both_tasks_nonexistent(mock_db_path):
         DependencyRepository.add_dependency("nonexistent-1", "nonexistent-2")
 
 
-def test_add_dependency_duplicate(mock_db_path):
+def test_add_dependency_duplicate():
     """Test that adding the same dependency twice raises an error."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -106,7 +90,7 @@ def test_add_dependency_duplicate(mock_db_path):
         DependencyRepository.add_dependency("task-b", "task-a")
 
 
-def test_add_dependency_circular_direct(mock_db_path):
+def test_add_dependency_circular_direct():
     """Test that direct circular dependencies are prevented (A -> B, B -> A)."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -120,7 +104,7 @@ def test_add_dependency_circular_direct(mock_db_path):
         DependencyRepository.add_dependency("task-a", "task-b")
 
 
-def test_add_dependency_circular_indirect(mock_db_path):
+def test_add_dependency_circular_indirect():
     """Test that indirect circular dependencies are prevented (A -> B -> C -> A)."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -136,7 +120,7 @@ def test_add_dependency_circular_indirect(mock_db_path):
         DependencyRepository.add_dependency("task-a", "task-c")
 
 
-def test_add_dependency_circular_complex(mock_db_path):
+def test_add_dependency_circular_complex():
     """Test circular dependency prevention in a complex graph."""
     # Create a more complex dependency graph
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -158,7 +142,7 @@ def test_add_dependency_circular_complex(mock_db_path):
         DependencyRepository.add_dependency("task-a", "task-d")
 
 
-def test_add_dependency_diamond_pattern(mock_db_path):
+def test_add_dependency_diamond_pattern():
     """Test that diamond dependency patterns are allowed (not circular)."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -181,7 +165,7 @@ def test_add_dependency_diamond_pattern(mock_db_path):
     assert len(all_deps) == 4
 
 
-def test_add_dependency_affects_available_tasks(mock_db_path):
+def test_add_dependency_affects_available_tasks():
     """Test that adding dependencies affects which tasks are available."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec", status="pending")
@@ -200,7 +184,7 @@ def test_add_dependency_affects_available_tasks(mock_db_path):
     assert available[0].name == "task-a"
 
 
-def test_add_dependency_with_completed_dependency(mock_db_path):
+def test_add_dependency_with_completed_dependency():
     """Test adding a dependency where the dependency task is already completed."""
     # Create tasks
     TaskRepository.add_task(
@@ -220,7 +204,7 @@ def test_add_dependency_with_completed_dependency(mock_db_path):
     assert available[0].name == "task-b"
 
 
-def test_add_dependency_list_by_task(mock_db_path):
+def test_add_dependency_list_by_task():
     """Test listing dependencies for a specific task after adding."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -244,7 +228,7 @@ def test_add_dependency_list_by_task(mock_db_path):
     assert len(deps_c) == 2
 
 
-def test_add_dependency_ordering(mock_db_path):
+def test_add_dependency_ordering():
     """Test that dependencies are returned in a consistent order."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -265,7 +249,7 @@ def test_add_dependency_ordering(mock_db_path):
     assert deps[2].task_name == "task-c"
 
 
-def test_add_dependency_self_dependency_prevented(mock_db_path):
+def test_add_dependency_self_dependency_prevented():
     """Test that self-dependencies are prevented (task depending on itself)."""
     # Create a task
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -276,7 +260,7 @@ def test_add_dependency_self_dependency_prevented(mock_db_path):
         DependencyRepository.add_dependency("task-a", "task-a")
 
 
-def test_add_dependency_multiple_dependents(mock_db_path):
+def test_add_dependency_multiple_dependents():
     """Test that multiple tasks can depend on the same task."""
     # Create tasks
     TaskRepository.add_task("base-task", "Base Task", specification="Spec")
@@ -294,16 +278,21 @@ def test_add_dependency_multiple_dependents(mock_db_path):
     assert len(deps) == 3
 
 
-def test_add_dependency_long_chain(mock_db_path):
+def test_add_dependency_long_chain():
     """Test creating a long chain of dependencies."""
     # Create a long chain of tasks
     chain_length = 8
-    for i in range(chain_length):
-        TaskRepository.add_task(f"task-{i}", f"Task {i}", specification="Spec")
+    TaskRepository.add_tasks_bulk(
+        [
+            {"name": f"task-{i}", "description": f"Task {i}", "specification": "Spec"}
+            for i in range(chain_length)
+        ]
+    )
 
     # Create chain: each task depends on the previous one
-    for i in range(1, chain_length):
-        DependencyRepository.add_dependency(f"task-{i}", f"task-{i - 1}")
+    DependencyRepository.add_dependencies_bulk(
+        [(f"task-{i}", f"task-{i - 1}") for i in range(1, chain_length)]
+    )
 
     # Verify chain length
     all_deps = DependencyRepository.list_dependencies()
@@ -312,3 +301,48 @@ def test_add_dependency_long_chain(mock_db_path):
     # Try to create circular dependency with long chain
     with pytest.raises(ValueError, match="[Cc]ircular"):
         DependencyRepository.add_dependency("task-0", f"task-{chain_length - 1}")
+
+
+def test_add_dependencies_bulk_creates_all():
+    """Test adding several dependencies in one call."""
+    TaskRepository.add_tasks_bulk(
+        [
+            {"name": name, "description": name, "specification": "Spec"}
+            for name in ("task-a", "task-b", "task-c")
+        ]
+    )
+
+    deps = DependencyRepository.add_dependencies_bulk(
+        [("task-b", "task-a"), ("task-c", "task-b")]
+    )
+
+    assert [(d.task_name, d.depends_on_task_name) for d in deps] == [
+        ("task-b", "task-a"),
+        ("task-c", "task-b"),
+    ]
+    assert len(DependencyRepository.list_dependencies()) == 2
+
+
+def test_add_dependencies_bulk_missing_task():
+    """Test that bulk dependency insert rejects unknown tasks before writing."""
+    TaskRepository.add_task("task-a", "Task A", specification="Spec")
+
+    with pytest.raises(ValueError, match="missing-task"):
+        DependencyRepository.add_dependencies_bulk([("task-a", "missing-task")])
+
+    assert DependencyRepository.list_dependencies() == []
+
+
+def test_add_dependencies_bulk_circular_prevented():
+    """Test that a bulk insert closing a cycle is rejected."""
+    TaskRepository.add_tasks_bulk(
+        [
+            {"name": name, "description": name, "specification": "Spec"}
+            for name in ("task-a", "task-b")
+        ]
+    )
+
+    with pytest.raises(ValueError, match="[Cc]ircular"):
+        DependencyRepository.add_dependencies_bulk(
+            [("task-b", "task-a"), ("task-a", "task-b")]
+        )
@@ -2,34 +2,16 @@
 Tests for the list_dependencies tool with and without task name filter.
 """
 
-from pathlib import Path
-
-import pytest
-
 from tasktree.core.database import DependencyRepository, TaskRepository
 
 
-@pytest.fixture
-def mock_db_path(test_db: Path, monkeypatch):
-    """
-    Mock the DB_PATH to use the test database.
-
-    This fixture modifies the database.DB_PATH to point to the test database,
-    ensuring all repository operations use the isolated test database.
-    """
-    import tasktree.core.database as db_module
-
-    monkeypatch.setattr(db_module, "DB_PATH", test_db)
-    return test_db
-
-
-def test_list_dependencies_empty_database(mock_db_path):
+def test_list_dependencies_empty_database():
     """Test listing dependencies when database is empty."""
     deps = DependencyRepository.list_dependencies()
     assert deps == []
 
 
-def test_list_dependencies_no_dependencies(mock_db_path):
+def test_list_dependencies_no_dependencies():
     """Test listing dependencies when tasks exist but no dependencies."""
     # Create tasks without dependencies
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -39,7 +21,7 @@ def test_list_dependencies_no_dependencies(mock_db_path):
     assert deps == []
 
 
-def test_list_dependencies_all_basic(mock_db_path):
+def test_list_dependencies_all_basic():
     """Test listing all dependencies with a basic setup."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -56,7 +38,7 @@ def test_list_dependencies_all_basic(mock_db_path):
     assert deps[0].depends_on_task_name == "task-a"
 
 
-def test_list_dependencies_all_multiple(mock_db_path):
+def test_list_dependencies_all_multiple():
     """Test listing all dependencies with multiple dependencies."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -81,7 +63,7 @@ def test_list_dependencies_all_multiple(mock_db_path):
     assert deps[2].depends_on_task_name == "task-b"
 
 
-def test_list_dependencies_all_ordering(mock_db_path):
+def test_list_dependencies_all_ordering():
     """Test that listing all dependencies returns them in correct order."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -108,7 +90,7 @@ def test_list_dependencies_all_ordering(mock_db_path):
     assert deps[3].depends_on_task_name == "task-c"
 
 
-def test_list_dependencies_filtered_task_as_dependent(mock_db_path):
+def test_list_dependencies_filtered_task_as_dependent():
     """Test listing dependencies filtered by a task that depends on others."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -127,7 +109,7 @@ def test_list_dependencies_filtered_task_as_dependent(mock_db_path):
     assert {dep.depends_on_task_name for dep in deps} == {"task-a", "task-b"}
 
 
-def test_list_dependencies_filtered_task_as_dependency(mock_db_path):
+def test_list_dependencies_filtered_task_as_dependency():
     """Test listing dependencies filtered by a task that others depend on."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -146,7 +128,7 @@ def test_list_dependencies_filtered_task_as_dependency(mock_db_path):
     assert {dep.task_name for dep in deps} == {"task-b", "task-c"}
 
 
-def test_list_dependencies_filtered_task_both_roles(mock_db_path):
+def test_list_dependencies_filtered_task_both_roles():
     """Test listing dependencies for a task that is both dependent and dependency."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -171,7 +153,7 @@ def test_list_dependencies_filtered_task_both_roles(mock_db_path):
     assert "task-c" in task_names
 
 
-def test_list_dependencies_filtered_nonexistent_task(mock_db_path):
+def test_list_dependencies_filtered_nonexistent_task():
     """Test listing dependencies for a task that doesn't exist."""
     # Create some tasks and dependencies
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -185,7 +167,7 @@ def test_list_dependencies_filtered_nonexistent_task(mock_db_path):
     assert deps == []
 
 
-def test_list_dependencies_filtered_task_no_dependencies(mock_db_path):
+def test_list_dependencies_filtered_task_no_dependencies():
     """Test listing dependencies for a task that exists but has no dependencies."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -202,7 +184,7 @@ def test_list_dependencies_filtered_task_no_dependencies(mock_db_path):
     assert deps == []
 
 
-def test_list_dependencies_filtered_complex_graph(mock_db_path):
+def test_list_dependencies_filtered_complex_graph():
     """Test listing dependencies in a complex dependency graph."""
     # Create a complex graph:
     # D depends on B and C
@@ -229,7 +211,7 @@ def test_list_dependencies_filtered_complex_graph(mock_db_path):
     assert all(dep.task_name == "task-d" for dep in deps_d)
 
 
-def test_list_dependencies_all_diamond_pattern(mock_db_path):
+def test_list_dependencies_all_diamond_pattern():
     """Test listing all dependencies in a diamond pattern."""
     # Create diamond pattern:
     # D depends on B and C
@@ -260,7 +242,7 @@ def test_list_dependencies_all_diamond_pattern(mock_db_path):
     assert dep_pairs == expected_pairs
 
 
-def test_list_dependencies_filtered_ordering(mock_db_path):
+def test_list_dependencies_filtered_ordering():
     """Test that filtered dependencies are returned in correct order."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -288,7 +270,7 @@ def test_list_dependencies_filtered_ordering(mock_db_path):
     assert deps[2].depends_on_task_name == "task-c"
 
 
-def test_list_dependencies_long_chain(mock_db_path):
+def test_list_dependencies_long_chain():
     """Test listing dependencies in a long chain."""
     # Create a long chain: task-0 <- task-1 <- task-2 <- ... <- task-7
     chain_length = 8
@@ -308,7 +290,7 @@ def test_list_dependencies_long_chain(mock_db_path):
     assert len(deps_middle) == 2
 
 
-def test_list_dependencies_multiple_independents(mock_db_path):
+def test_list_dependencies_multiple_independents():
     """Test listing dependencies with multiple independent dependency trees."""
     # Create two independent trees
     # Tree 1: B depends on A
@@ -2,28 +2,12 @@
 Tests for the remove_dependency tool verifying relationship removal.
 """
 
-from pathlib import Path
-
 import pytest
 
 from tasktree.core.database import DependencyRepository, TaskRepository
 
 
-@pytest.fixture
-def mock_db_path(test_db: Path, monkeypatch):
-    """
-    Mock the DB_PATH to use the test database.
-
-    This fixture modifies the database.DB_PATH to point to the test database,
-    ensuring all repository operations use the isolated test database.
-    """
-    import tasktree.core.database as db_module
-
-    monkeypatch.setattr(db_module, "DB_PATH", test_db)
-    return test_db
-
-
-def test_remove_dependency_basic(mock_db_path):
+def test_remove_dependency_basic():
     """Test removing a basic dependency between two tasks."""
     # Create tasks and add dependency
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -45,7 +29,7 @@ def test_remove_dependency_basic(mock_db_path):
     assert len(deps) == 0
 
 
-def test_remove_dependency_nonexistent(mock_db_path):
+def test_remove_dependency_nonexistent():
     """Test removing a dependency that doesn't exist."""
     # Create tasks but no dependency
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -58,7 +42,7 @@ def test_remove_dependency_nonexistent(mock_db_path):
     assert result is False
 
 
-def test_remove_dependency_nonexistent_tasks(mock_db_path):
+def test_remove_dependency_nonexistent_tasks():
     """Test removing a dependency where tasks don't exist."""
     # Try to remove dependency between non-existent tasks
     result = DependencyRepository.remove_dependency("nonexistent-1", "nonexistent-2")
@@ -67,7 +51,7 @@ def test_remove_dependency_nonexistent_tasks(mock_db_path):
     assert result is False
 
 
-def test_remove_dependency_one_of_multiple(mock_db_path):
+def test_remove_dependency_one_of_multiple():
     """Test removing one dependency when multiple exist for a task."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -93,7 +77,7 @@ def test_remove_dependency_one_of_multiple(mock_db_path):
     assert deps[0].depends_on_task_name == "task-b"
 
 
-def test_remove_dependency_from_chain(mock_db_path):
+def test_remove_dependency_from_chain():
     """Test removing a dependency from a chain (A -> B -> C)."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -119,7 +103,7 @@ def test_remove_dependency_from_chain(mock_db_path):
     assert all_deps[0].depends_on_task_name == "task-b"
 
 
-def test_remove_dependency_affects_available_tasks(mock_db_path):
+def test_remove_dependency_affects_available_tasks():
     """Test that removing dependencies affects which tasks are available."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec", status="pending")
@@ -138,12 +122,10 @@ def test_remove_dependency_affects_available_tasks(mock_db_path):
 
     # Now both tasks should be available
     available = DependencyRepository.get_available_tasks()
-    assert len(available) == 2
-    task_names = {task.name for task in available}
-    assert task_names == {"task-a", "task-b"}
+    assert [task.name for task in available] == ["task-a", "task-b"]
 
 
-def test_remove_dependency_wrong_direction(mock_db_path):
+def test_remove_dependency_wrong_direction():
     """Test that removing dependency in wrong direction doesn't work."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -169,7 +151,7 @@ def test_remove_dependency_wrong_direction(mock_db_path):
     assert deps[0].depends_on_task_name == "task-a"
 
 
-def test_remove_dependency_diamond_pattern(mock_db_path):
+def test_remove_dependency_diamond_pattern():
     """Test removing a dependency from a diamond pattern."""
     # Create diamond pattern:
     # D depends on B and C
@@ -207,7 +189,7 @@ def test_remove_dependency_diamond_pattern(mock_db_path):
     assert dep_pairs == expected_pairs
 
 
-def test_remove_dependency_all_from_task(mock_db_path):
+def test_remove_dependency_all_from_task():
     """Test removing all dependencies from a task one by one."""
     # Create tasks
     TaskRepository.add_task("base-task", "Base Task", specification="Spec")
@@ -241,7 +223,7 @@ def test_remove_dependency_all_from_task(mock_db_path):
     assert len(deps) == 0
 
 
-def test_remove_dependency_idempotent(mock_db_path):
+def test_remove_dependency_idempotent():
     """Test that removing the same dependency twice is idempotent."""
     # Create tasks and add dependency
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -257,7 +239,7 @@ def test_remove_dependency_idempotent(mock_db_path):
     assert result2 is False
 
 
-def test_remove_dependency_complex_graph(mock_db_path):
+def test_remove_dependency_complex_graph():
     """Test removing a dependency in a complex graph."""
     # Create a complex graph:
     # E depends on D
@@ -298,7 +280,7 @@ def test_remove_dependency_complex_graph(mock_db_path):
     assert dep_pairs == expected_pairs
 
 
-def test_remove_dependency_allows_circular_after_removal(mock_db_path):
+def test_remove_dependency_allows_circular_after_removal():
     """Test that removing a dependency allows previously blocked circular dependency."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -320,7 +302,7 @@ def test_remove_dependency_allows_circular_after_removal(mock_db_path):
     assert dep.depends_on_task_name == "task-b"
 
 
-def test_remove_dependency_tasks_remain(mock_db_path):
+def test_remove_dependency_tasks_remain():
     """Test that removing a dependency doesn't delete the tasks."""
     # Create tasks and add dependency
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -340,7 +322,7 @@ def test_remove_dependency_tasks_remain(mock_db_path):
     assert task_b.name == "task-b"
 
 
-def test_remove_dependency_long_chain(mock_db_path):
+def test_remove_dependency_long_chain():
     """Test removing a dependency from a long chain."""
     # Create a long chain of tasks
     chain_length = 8
@@ -368,7 +350,7 @@ def test_remove_dependency_long_chain(mock_db_path):
     assert len(deps_task4) == 0
 
 
-def test_remove_dependency_with_completed_tasks(mock_db_path):
+def test_remove_dependency_with_completed_tasks():
     """Test removing a dependency where tasks are completed."""
     # Create tasks with different statuses
     TaskRepository.add_task(
@@ -392,7 +374,7 @@ def test_remove_dependency_with_completed_tasks(mock_db_path):
     assert len(deps) == 0
 
 
-def test_remove_dependency_multiple_independents(mock_db_path):
+def test_remove_dependency_multiple_independents():
     """Test removing dependencies in multiple independent trees."""
     # Create two independent trees
     # Tree 1: B depends on A
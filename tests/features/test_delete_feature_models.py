@@ -6,6 +6,8 @@ from tasktree.core.models import DeleteFeatureRequest, FeatureDeleteResponse
 import pytest
 from pydantic import ValidationError
 
+pytestmark = pytest.mark.no_db
+
 
 def test_delete_feature_request_valid():
     """Test valid DeleteFeatureRequest instantiation."""
@@ -2,7 +2,6 @@
 Tests for deleting features from the repository.
 """
 
-from pathlib import Path
 import pytest
 
 from tasktree.core.database import (
@@ -12,18 +11,7 @@ from tasktree.core.database import (
 )
 
 
-@pytest.fixture
-def mock_db_path(test_db: Path, monkeypatch):
-    """
-    Mock the DB_PATH to use the test database.
-    """
-    import tasktree.core.database as db_module
-
-    monkeypatch.setattr(db_module, "DB_PATH", test_db)
-    return test_db
-
-
-def test_delete_feature_success(mock_db_path):
+def test_delete_feature_success():
     """Test successfully deleting a feature."""
     # Arrange
     FeatureRepository.add_feature(
@@ -38,7 +26,7 @@ def test_delete_feature_success(mock_db_path):
     assert FeatureRepository.get_feature("test-feature") is None
 
 
-def test_delete_nonexistent_feature(mock_db_path):
+def test_delete_nonexistent_feature():
     """Test deleting a feature that does not exist."""
     # Act
     deleted = FeatureRepository.delete_feature("nonexistent")
@@ -47,14 +35,14 @@ def test_delete_nonexistent_feature(mock_db_path):
     assert deleted is False
 
 
-def test_delete_misc_feature_fails(mock_db_path):
+def test_delete_misc_feature_fails():
     """Test that deleting the 'misc' feature raises a ValueError."""
     # Act & Assert
     with pytest.raises(ValueError, match="The 'misc' feature cannot be deleted"):
         FeatureRepository.delete_feature("misc")
 
 
-def test_delete_feature_cascades_to_tasks(mock_db_path):
+def test_delete_feature_cascades_to_tasks():
     """Test that deleting a feature cascades to its tasks."""
     # Arrange
     FeatureRepository.add_feature(
@@ -85,7 +73,7 @@ def test_delete_feature_cascades_to_tasks(mock_db_path):
     assert TaskRepository.get_task("task-2") is None
 
 
-def test_delete_feature_cascades_to_dependencies(mock_db_path):
+def test_delete_feature_cascades_to_dependencies():
     """Test that deleting a feature cascades to dependencies between its tasks."""
     # Arrange
     FeatureRepository.add_feature(
@@ -4,46 +4,45 @@ Tests for the features table schema and default feature seeding.
 
 import sqlite3
 
+EXPECTED_FEATURE_COLUMNS = frozenset(
+    {
+        "id",
+        "name",
+        "description",
+        "specification",
+        "created_at",
+        "updated_at",
+    }
+)
+
+INSERT_FEATURE_SQL = (
+    "INSERT INTO features (name, description, specification) VALUES (?, ?, ?)"
+)
+
 
 def test_features_table_exists(test_db_connection: sqlite3.Connection):
     """Test that the features table exists."""
-    cursor = test_db_connection.cursor()
-
-    cursor.execute(
+    result = test_db_connection.execute(
         "SELECT name FROM sqlite_master WHERE type='table' AND name='features'"
-    )
-    result = cursor.fetchone()
+    ).fetchone()
     assert result is not None
 
 
-def test_features_table_schema(test_db_connection: sqlite3.Connection):
+def test_features_table_schema(table_columns: dict[str, dict[str, int]]):
     """Test that the features table has the correct schema."""
-    cursor = test_db_connection.cursor()
+    columns = table_columns["features"]
 
-    # Check that the table has expected columns
-    cursor.execute("PRAGMA table_info(features)")
-    columns = {row["name"]: row for row in cursor.fetchall()}
-
-    expected_columns = {
-        "id",
-        "name",
-        "description",
-        "specification",
-        "created_at",
-        "updated_at",
-    }
-    assert expected_columns.issubset(set(columns.keys()))
+    assert EXPECTED_FEATURE_COLUMNS.issubset(columns.keys())
 
     # Verify id is the primary key
-    assert columns["id"]["pk"] == 1
+    assert columns["id"] == 1
 
 
 def test_default_feature_is_seeded(test_db_connection: sqlite3.Connection):
     """Test that the default feature is automatically seeded."""
-    cursor = test_db_connection.cursor()
-
-    cursor.execute("SELECT * FROM features WHERE name = 'misc'")
-    result = cursor.fetchone()
+    result = test_db_connection.execute(
+        "SELECT * FROM features WHERE name = 'misc'"
+    ).fetchone()
 
     assert result is not None
     assert result["name"] == "misc"
@@ -56,11 +55,9 @@ def test_default_feature_is_seeded(test_db_connection: sqlite3.Connection):
 
 def test_features_name_is_primary_key(test_db_connection: sqlite3.Connection):
     """Test that feature name is a unique primary key."""
-    cursor = test_db_connection.cursor()
-
     # Try to insert a duplicate feature name
-    cursor.execute(
-        "INSERT INTO features (name, description, specification) VALUES (?, ?, ?)",
+    test_db_connection.execute(
+        INSERT_FEATURE_SQL,
         (
             "test-feature",
             "First insert",
@@ -71,8 +68,8 @@ def test_features_name_is_primary_key(test_db_connection: sqlite3.Connection):
 
     # Attempt to insert duplicate should fail
     try:
-        cursor.execute(
-            "INSERT INTO features (name, description, specification) VALUES (?, ?, ?)",
+        test_db_connection.execute(
+            INSERT_FEATURE_SQL,
             (
                 "test-feature",
                 "Duplicate insert",
@@ -88,10 +85,8 @@ def test_features_name_is_primary_key(test_db_connection: sqlite3.Connection):
 
 def test_specification_is_required(test_db_connection: sqlite3.Connection):
     """Test that specification is required for new features."""
-    cursor = test_db_connection.cursor()
-
     try:
-        cursor.execute(
+        test_db_connection.execute(
             "INSERT INTO features (name, description) VALUES (?, ?)",
             ("missing-spec", "No specification provided"),
         )
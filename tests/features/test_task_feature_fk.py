@@ -2,28 +2,12 @@
 Tests for task feature_name foreign key constraint.
 """
 
-from pathlib import Path
-
 import pytest
 
 from tasktree.core.database import TaskRepository
 
 
-@pytest.fixture
-def mock_db_path(test_db: Path, monkeypatch):
-    """
-    Mock the DB_PATH to use the test database.
-
-    This fixture modifies the database.DB_PATH to point to the test database,
-    ensuring all repository operations use the isolated test database.
-    """
-    import tasktree.core.database as db_module
-
-    monkeypatch.setattr(db_module, "DB_PATH", test_db)
-    return test_db
-
-
-def test_add_task_default_feature(mock_db_path):
+def test_add_task_default_feature():
     """Test that tasks get 'misc' feature_name by default."""
     task = TaskRepository.add_task(
         name="test-task", description="A test task", specification="Spec"
@@ -32,7 +16,7 @@ def test_add_task_default_feature(mock_db_path):
     assert task.feature_name == "misc"
 
 
-def test_add_task_explicit_misc_feature(mock_db_path):
+def test_add_task_explicit_misc_feature():
     """Test explicitly setting feature_name to 'misc'."""
     task = TaskRepository.add_task(
         name="test-task",
@@ -44,7 +28,7 @@ def test_add_task_explicit_misc_feature(mock_db_path):
     assert task.feature_name == "misc"
 
 
-def test_add_task_nonexistent_feature(mock_db_path):
+def test_add_task_nonexistent_feature():
     """Test that adding a task with non-existent feature raises an error."""
     with pytest.raises(ValueError, match="does not exist"):
         TaskRepository.add_task(
@@ -55,7 +39,7 @@ def test_add_task_nonexistent_feature(mock_db_path):
         )
 
 
-def test_list_tasks_includes_feature_name(mock_db_path):
+def test_list_tasks_includes_feature_name():
     """Test that listing tasks includes feature_name."""
     TaskRepository.add_task(
         name="task-1",
@@ -69,7 +53,7 @@ def test_list_tasks_includes_feature_name(mock_db_path):
     assert tasks[0].feature_name == "misc"
 
 
-def test_get_task_includes_feature_name(mock_db_path):
+def test_get_task_includes_feature_name():
     """Test that getting a task includes feature_name."""
     TaskRepository.add_task(
         name="test-task",
@@ -83,7 +67,7 @@ def test_get_task_includes_feature_name(mock_db_path):
     assert task.feature_name == "misc"
 
 
-def test_add_task_with_all_parameters_including_feature(mock_db_path):
+def test_add_task_with_all_parameters_including_feature():
     """Test adding a task with all parameters including feature_name."""
     task = TaskRepository.add_task(
         name="full-task",
@@ -0,0 +1,103 @@
+"""
+Shared fixtures for the graph server tests.
+"""
+
+import json
+from collections.abc import Iterator
+from http.client import HTTPConnection, HTTPResponse
+from pathlib import Path
+from threading import Thread
+
+import pytest
+
+from tasktree.graph.server import create_server
+
+
+class KeepAliveClient:
+    """One persistent HTTP/1.1 connection to the test server."""
+
+    def __init__(self, port: int) -> None:
+        self._conn = HTTPConnection("localhost", port)
+
+    def get(self, path: str) -> tuple[HTTPResponse, bytes]:
+        """
+        GET a path and drain the body so the connection can be reused.
+
+        The body is read before the caller asserts anything, so a failing
+        test never leaves the shared connection mid-response.
+        """
+        self._conn.request("GET", path)
+        response = self._conn.getresponse()
+        return response, response.read()
+
+    def get_json(self, path: str) -> dict:
+        """GET a JSON endpoint and decode the body."""
+        response, body = self.get(path)
+        assert response.status == 200
+        return json.loads(body)
+
+    def get_text(self, path: str) -> str:
+        """GET a text endpoint and decode the body."""
+        response, body = self.get(path)
+        assert response.status == 200
+        return body.decode()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+@pytest.fixture(scope="session")
+def server_thread(test_db: Path) -> Iterator[int]:
+    """
+    Start the graph server in a background thread once for the session.
+
+    The handler opens its connection per request through sqlite3.connect,
+    which the autouse _isolated_db fixture redirects to the current test's
+    database, so one server serves every test's fresh copy.
+
+    Args:
+        test_db: Path to the test database
+
+    Yields:
+        int: port number the server is listening on
+    """
+    # Bind port 0 so the OS picks a free port; the socket is already
+    # listening when create_server returns, so no readiness wait is needed
+    httpd = create_server(0, test_db)
+    thread = Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        yield httpd.server_address[1]
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+@pytest.fixture(scope="session")
+def http_client(server_thread: int) -> Iterator[KeepAliveClient]:
+    """
+    Share one keep-alive connection to the graph server across the session.
+
+    Yields:
+        KeepAliveClient: Client bound to the shared server's port
+    """
+    client = KeepAliveClient(server_thread)
+    try:
+        yield client
+    finally:
+        client.close()
+
+
+@pytest.fixture(scope="session")
+def graph_js(http_client: KeepAliveClient) -> str:
+    """
+    Fetch the served graph.js asset once for the session.
+
+    The asset is static, so tests that only inspect its source share one
+    response instead of each making their own request.
+
+    Returns:
+        str: Decoded graph.js content
+    """
+    return http_client.get_text("/static/graph.js")
@@ -0,0 +1,97 @@
+"""
+Tests for the v_graph_dot view.
+"""
+
+import re
+import sqlite3
+
+import pytest
+
+DOT_NODE_RE = re.compile(r'^\s*"([^"]+)"\s*\[([^\]]*)\]', re.MULTILINE)
+
+STATUS_TASKS = {
+    "pending-task": "pending",
+    "in-progress-task": "in_progress",
+    "completed-task": "completed",
+    "blocked-task": "blocked",
+}
+
+
+@pytest.fixture(scope="module")
+def dot_graph(_template_db: sqlite3.Connection) -> str:
+    """
+    Seed one task per status into a copy of the template and render DOT once.
+
+    Returns:
+        str: The dot_graph value from v_graph_dot
+    """
+    conn = sqlite3.connect(":memory:")
+    try:
+        _template_db.backup(conn)
+        conn.executemany(
+            """
+            INSERT INTO tasks (feature_id, name, description, specification, status)
+            SELECT id, ?, ?, 'Spec', ? FROM features WHERE name = 'misc'
+            """,
+            [(name, name, status) for name, status in STATUS_TASKS.items()],
+        )
+        conn.execute(
+            """
+            INSERT INTO dependencies (task_id, depends_on_task_id)
+            SELECT t.id, d.id
+            FROM tasks t
+            JOIN tasks d ON d.name = 'completed-task'
+            WHERE t.name = 'pending-task'
+            """
+        )
+        return conn.execute("SELECT dot_graph FROM v_graph_dot").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def parse_dot_nodes(dot: str) -> dict[str, str]:
+    """Map every node name in a DOT string to its attribute list."""
+    return {match[1]: match[2] for match in DOT_NODE_RE.finditer(dot)}
+
+
+@pytest.fixture(scope="module")
+def dot_nodes(dot_graph: str) -> dict[str, str]:
+    """Parse the node attributes out of the cached DOT output once."""
+    return parse_dot_nodes(dot_graph)
+
+
+def test_graph_dot_is_digraph(dot_graph):
+    """Test that the DOT output is a complete digraph."""
+    assert dot_graph.startswith("digraph TaskTree {")
+    assert dot_graph.rstrip().endswith("}")
+
+
+@pytest.mark.parametrize(
+    ("task_name", "color"),
+    [
+        ("pending-task", "lightblue"),
+        ("in-progress-task", "yellow"),
+        ("completed-task", "lightgreen"),
+        ("blocked-task", "lightgray"),
+    ],
+)
+def test_graph_dot_status_colors(dot_nodes, task_name, color):
+    """Test that each task is filled with its status color."""
+    assert f"fillcolor={color}" in dot_nodes[task_name]
+
+
+def test_graph_dot_marks_available_tasks(dot_nodes):
+    """Test that only available tasks get the thicker border."""
+    assert "penwidth=3" in dot_nodes["pending-task"]
+    assert "penwidth=3" not in dot_nodes["completed-task"]
+
+
+def test_graph_dot_all_nodes_filled(dot_nodes):
+    """Test that every seeded task is rendered as a filled node."""
+    assert dot_nodes.keys() == STATUS_TASKS.keys()
+    assert all('style="rounded,filled"' in attrs for attrs in dot_nodes.values())
+
+
+def test_graph_dot_includes_edges(dot_graph):
+    """Test that dependencies render as dependency -> dependent edges."""
+    assert '"completed-task" -> "pending-task";' in dot_graph
@@ -1,4 +1,20 @@
-from tasktree.graph.server import GraphAPIHandler
+import socket
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tasktree.graph.server import GraphAPIHandler, create_server, run_server
+
+
+@pytest.fixture(autouse=True)
+def _restore_handler_db_path(monkeypatch):
+    """Undo run_server's class-level db_path so the shared server keeps its own."""
+    monkeypatch.setattr(
+        GraphAPIHandler,
+        "db_path",
+        getattr(GraphAPIHandler, "db_path", None),
+        raising=False,
+    )
 
 
 def test_log_message_is_silenced(capsys):
@@ -14,9 +30,6 @@ def test_log_message_is_silenced(capsys):
 
 def test_server_startup_messages_still_print(capsys, tmp_path):
     """Test that run_server still prints startup messages."""
-    from tasktree.graph.server import run_server
-    import socket
-
     # Create a dummy database file
     db_path = tmp_path / "test.db"
     db_path.touch()
@@ -26,9 +39,7 @@ def test_server_startup_messages_still_print(capsys, tmp_path):
         s.bind(("", 0))
         port = s.getsockname()[1]
 
-    from unittest.mock import patch, MagicMock
-
-    with patch("tasktree.graph.server.HTTPServer") as mock_server_class:
+    with patch("tasktree.graph.server.ThreadingHTTPServer") as mock_server_class:
         mock_server = MagicMock()
         mock_server_class.return_value = mock_server
 
@@ -38,3 +49,15 @@ def test_server_startup_messages_still_print(capsys, tmp_path):
         assert "TaskTree Graph API Server" in captured.out
         assert f"Listening on: http://localhost:{port}" in captured.out
         assert "Press Ctrl+C to stop" in captured.out
+
+
+def test_create_server_binds_os_assigned_port(tmp_path):
+    """Test that create_server binds port 0 to a real port before serving."""
+    httpd = create_server(0, tmp_path / "test.db")
+    try:
+        port = httpd.server_address[1]
+        assert port != 0
+        # The socket is already listening, so a client can connect
+        socket.create_connection(("localhost", port), timeout=1).close()
+    finally:
+        httpd.server_close()
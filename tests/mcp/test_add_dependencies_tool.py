@@ -2,7 +2,6 @@
 Tests for the add_dependencies MCP tool.
 """
 
-from pathlib import Path
 from typing import Any, cast
 
 import pytest
@@ -27,20 +26,6 @@ class FakeMCP:
         return decorator
 
 
-@pytest.fixture
-def mock_db_path(test_db: Path, monkeypatch):
-    """
-    Mock the DB_PATH to use the test database.
-
-    This fixture modifies the database.DB_PATH to point to the test database,
-    ensuring all repository operations use the isolated test database.
-    """
-    import tasktree.core.database as db_module
-
-    monkeypatch.setattr(db_module, "DB_PATH", test_db)
-    return test_db
-
-
 def get_dependency_tools():
     """Register dependency tools and return the tool mapping."""
     mcp = FakeMCP()
@@ -56,7 +41,7 @@ def test_add_dependencies_tool_registration():
     assert "add_dependency" not in tools
 
 
-def test_add_dependencies_tool_creates_multiple(mock_db_path):
+def test_add_dependencies_tool_creates_multiple():
     """Test that add_dependencies creates multiple dependencies."""
     tools = get_dependency_tools()
 
@@ -73,7 +58,7 @@ def test_add_dependencies_tool_creates_multiple(mock_db_path):
     assert {dep.depends_on_task_name for dep in deps} == {"task-a", "task-b"}
 
 
-def test_add_dependencies_tool_reports_failures(mock_db_path):
+def test_add_dependencies_tool_reports_failures():
     """Test that add_dependencies reports failures but still inserts successes."""
     tools = get_dependency_tools()
 
@@ -2,7 +2,6 @@
 Tests for the delete_feature MCP tool.
 """
 
-from pathlib import Path
 from typing import Any, cast
 
 import pytest
@@ -27,17 +26,6 @@ class FakeMCP:
         return decorator
 
 
-@pytest.fixture
-def mock_db_path(test_db: Path, monkeypatch):
-    """
-    Mock the DB_PATH to use the test database.
-    """
-    import tasktree.core.database as db_module
-
-    monkeypatch.setattr(db_module, "DB_PATH", test_db)
-    return test_db
-
-
 def get_feature_tools():
     """Register feature tools and return the tool mapping."""
     mcp = FakeMCP()
@@ -51,7 +39,7 @@ def test_delete_feature_tool_registration():
     assert "delete_feature" in tools
 
 
-def test_delete_feature_tool_success(mock_db_path):
+def test_delete_feature_tool_success():
     """Test that delete_feature tool successfully deletes a feature."""
     tools = get_feature_tools()
 
@@ -66,14 +54,14 @@ def test_delete_feature_tool_success(mock_db_path):
     assert FeatureRepository.get_feature("test-feature") is None
 
 
-def test_delete_feature_tool_not_found(mock_db_path):
+def test_delete_feature_tool_not_found():
     """Test that delete_feature tool returns False for non-existent feature."""
     tools = get_feature_tools()
     result = tools["delete_feature"]("non-existent")
     assert result is False
 
 
-def test_delete_feature_tool_misc_protection(mock_db_path):
+def test_delete_feature_tool_misc_protection():
     """Test that delete_feature tool protects the 'misc' feature."""
     tools = get_feature_tools()
     with pytest.raises(ValueError, match="The 'misc' feature cannot be deleted"):
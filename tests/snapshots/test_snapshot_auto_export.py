@@ -7,6 +7,7 @@ from pathlib import Path
 
 import pytest
 
+import tasktree.core.database as db_module
 from tasktree.core.database import (
     DependencyRepository,
     FeatureRepository,
@@ -46,11 +47,9 @@ def _assert_snapshot_matches(db_path: Path, snapshot_path: Path) -> None:
 
 
 @pytest.fixture
-def snapshot_env(test_db: Path, tmp_path: Path, monkeypatch) -> Path:
-    import tasktree.core.database as db_module
+def snapshot_env(tmp_path: Path, monkeypatch) -> Path:
 
     snapshot_path = tmp_path / "snapshot.jsonl"
-    monkeypatch.setattr(db_module, "DB_PATH", test_db)
     monkeypatch.setenv("TASKTREE_SNAPSHOT_PATH", str(snapshot_path))
     return snapshot_path
 
@@ -96,8 +95,6 @@ def test_auto_export_after_feature_write(snapshot_env: Path, test_db: Path) -> N
 def test_auto_export_failure_does_not_break_write(
     snapshot_env: Path, monkeypatch
 ) -> None:
-    import tasktree.core.database as db_module
-
     def _raise_export(*_args, **_kwargs) -> None:
         raise RuntimeError("export failed")
 
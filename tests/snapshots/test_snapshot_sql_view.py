@@ -164,12 +164,13 @@ def test_snapshot_jsonl_view_ordering_and_format(test_db: Path) -> None:
         meta_line,
     )
 
-    feature_line = next(
-        row["json_line"]
-        for row in rows
-        if '"record_type":"feature"' in row["json_line"]
-        and '"name":"alpha-feature"' in row["json_line"]
-    )
+    lines_by_name = {
+        (record["record_type"], record["name"]): row["json_line"]
+        for record, row in zip(records, rows)
+        if "name" in record
+    }
+
+    feature_line = lines_by_name[("feature", "alpha-feature")]
     assert '"specification":"Alpha specification"' in feature_line
     assert feature_line.index('"record_type"') < feature_line.index('"name"')
     assert feature_line.index('"name"') < feature_line.index('"description"')
@@ -177,12 +178,7 @@ def test_snapshot_jsonl_view_ordering_and_format(test_db: Path) -> None:
     assert feature_line.index('"specification"') < feature_line.index('"created_at"')
     assert feature_line.index('"created_at"') < feature_line.index('"updated_at"')
 
-    task_line = next(
-        row["json_line"]
-        for row in rows
-        if '"record_type":"task"' in row["json_line"]
-        and '"name":"task-b"' in row["json_line"]
-    )
+    task_line = lines_by_name[("task", "task-b")]
     assert '"tests_required":false' in task_line
     assert task_line.index('"record_type"') < task_line.index('"name"')
     assert task_line.index('"name"') < task_line.index('"description"')
@@ -196,11 +192,7 @@ def test_snapshot_jsonl_view_ordering_and_format(test_db: Path) -> None:
     assert task_line.index('"updated_at"') < task_line.index('"started_at"')
     assert task_line.index('"started_at"') < task_line.index('"completed_at"')
 
-    dependency_line = next(
-        row["json_line"]
-        for row in rows
-        if '"record_type":"dependency"' in row["json_line"]
-    )
+    dependency_line = rows[record_types.index("dependency")]["json_line"]
     assert dependency_line.index('"record_type"') < dependency_line.index('"task_name"')
     assert dependency_line.index('"task_name"') < dependency_line.index(
         '"depends_on_task_name"'
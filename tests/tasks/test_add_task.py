@@ -2,28 +2,12 @@
 Tests for the add_task tool including validation, duplicate names, specification field, and dependencies.
 """
 
-from pathlib import Path
-
 import pytest
 
 from tasktree.core.database import DependencyRepository, TaskRepository
 
 
-@pytest.fixture
-def mock_db_path(test_db: Path, monkeypatch):
-    """
-    Mock the DB_PATH to use the test database.
-
-    This fixture modifies the database.DB_PATH to point to the test database,
-    ensuring all repository operations use the isolated test database.
-    """
-    import tasktree.core.database as db_module
-
-    monkeypatch.setattr(db_module, "DB_PATH", test_db)
-    return test_db
-
-
-def test_add_task_basic(mock_db_path):
+def test_add_task_basic():
     """Test adding a basic task with minimal parameters."""
     task = TaskRepository.add_task(
         name="basic-task",
@@ -40,7 +24,7 @@ def test_add_task_basic(mock_db_path):
     assert task.created_at is not None
 
 
-def test_add_task_with_all_parameters(mock_db_path):
+def test_add_task_with_all_parameters():
     """Test adding a task with all parameters specified."""
     task = TaskRepository.add_task(
         name="full-task",
@@ -59,7 +43,7 @@ def test_add_task_with_all_parameters(mock_db_path):
     assert task.tests_required is False
 
 
-def test_add_task_with_tests_required_flag(mock_db_path):
+def test_add_task_with_tests_required_flag():
     """Test adding a task with tests_required flag."""
     task = TaskRepository.add_task(
         name="no-tests-task",
@@ -71,7 +55,7 @@ def test_add_task_with_tests_required_flag(mock_db_path):
     assert task.tests_required is False
 
 
-def test_add_task_with_priority_bounds(mock_db_path):
+def test_add_task_with_priority_bounds():
     """Test adding tasks with minimum and maximum priority values."""
     # Minimum priority
     task_min = TaskRepository.add_task(
@@ -92,7 +76,7 @@ def test_add_task_with_priority_bounds(mock_db_path):
     assert task_max.priority == 10
 
 
-def test_add_task_with_different_statuses(mock_db_path):
+def test_add_task_with_different_statuses():
     """Test adding tasks with different valid status values."""
     statuses = ["pending", "in_progress", "completed", "blocked"]
 
@@ -106,7 +90,7 @@ def test_add_task_with_different_statuses(mock_db_path):
         assert task.status == status
 
 
-def test_add_task_with_specification(mock_db_path):
+def test_add_task_with_specification():
     """Test adding a task with specification field."""
     task = TaskRepository.add_task(
         name="task-with-details",
@@ -117,7 +101,7 @@ def test_add_task_with_specification(mock_db_path):
     assert task.specification == "These are implementation details"
 
 
-def test_add_task_with_empty_specification(mock_db_path):
+def test_add_task_with_empty_specification():
     """Test adding a task with empty string specification raises ValidationError."""
     with pytest.raises(Exception):  # Catching pydantic ValidationError or ValueError
         TaskRepository.add_task(
@@ -127,7 +111,7 @@ def test_add_task_with_empty_specification(mock_db_path):
         )
 
 
-def test_add_task_missing_specification(mock_db_path):
+def test_add_task_missing_specification():
     """Test adding a task without specification raises TypeError."""
     with pytest.raises(TypeError):
         TaskRepository.add_task(
@@ -136,7 +120,7 @@ def test_add_task_missing_specification(mock_db_path):
         )
 
 
-def test_add_task_duplicate_name(mock_db_path):
+def test_add_task_duplicate_name():
     """Test that adding a task with duplicate name raises an error."""
     # Add first task
     TaskRepository.add_task(
@@ -154,7 +138,7 @@ def test_add_task_duplicate_name(mock_db_path):
         )
 
 
-def test_add_task_creates_timestamps(mock_db_path):
+def test_add_task_creates_timestamps():
     """Test that add_task creates appropriate timestamps."""
     # Task with pending status
     task_pending = TaskRepository.add_task(
@@ -188,7 +172,7 @@ def test_add_task_creates_timestamps(mock_db_path):
     assert task_completed.created_at is not None
 
 
-def test_add_task_special_characters_in_name(mock_db_path):
+def test_add_task_special_characters_in_name():
     """Test adding a task with special characters in the name."""
     special_names = [
         "task-with-dashes",
@@ -206,7 +190,7 @@ def test_add_task_special_characters_in_name(mock_db_path):
         assert task.name == name
 
 
-def test_add_task_long_description(mock_db_path):
+def test_add_task_long_description():
     """Test adding a task with a long description."""
     long_desc = "A" * 1000  # 1000 character description
 
@@ -219,7 +203,7 @@ def test_add_task_long_description(mock_db_path):
     assert task.description == long_desc
 
 
-def test_add_task_unicode_characters(mock_db_path):
+def test_add_task_unicode_characters():
     """Test adding a task with unicode characters."""
     task = TaskRepository.add_task(
         name="unicode-task",
@@ -233,7 +217,7 @@ def test_add_task_unicode_characters(mock_db_path):
     assert "✨" in task.specification
 
 
-def test_add_task_with_dependencies_via_tools_wrapper(mock_db_path):
+def test_add_task_with_dependencies_via_tools_wrapper():
     """Test adding a task with dependencies using the tools wrapper pattern."""
     # First create the dependency tasks
     TaskRepository.add_task("dependency-1", "First dependency", "Spec 1")
@@ -258,7 +242,7 @@ def test_add_task_with_dependencies_via_tools_wrapper(mock_db_path):
     assert task.name == "dependent-task"
 
 
-def test_add_task_nonexistent_dependency_validation(mock_db_path):
+def test_add_task_nonexistent_dependency_validation():
     """Test that adding dependencies to non-existent tasks is handled."""
     # Create a task
     TaskRepository.add_task("task-a", "Task A", "Spec A")
@@ -269,7 +253,7 @@ def test_add_task_nonexistent_dependency_validation(mock_db_path):
         DependencyRepository.add_dependency("task-a", "nonexistent-task")
 
 
-def test_add_task_multiple_tasks(mock_db_path):
+def test_add_task_multiple_tasks():
     """Test adding multiple tasks in sequence."""
     task_names = [f"task-{i}" for i in range(10)]
 
@@ -285,3 +269,81 @@ def test_add_task_multiple_tasks(mock_db_path):
     # Verify all tasks exist
     all_tasks = TaskRepository.list_tasks()
     assert len(all_tasks) == 10
+
+
+def test_add_tasks_bulk_creates_all_tasks():
+    """Test adding several tasks in one call."""
+    tasks = TaskRepository.add_tasks_bulk(
+        [
+            {"name": "bulk-1", "description": "First", "specification": "Spec"},
+            {
+                "name": "bulk-2",
+                "description": "Second",
+                "specification": "Spec",
+                "priority": 7,
+                "status": "in_progress",
+                "tests_required": False,
+            },
+        ]
+    )
+
+    assert [task.name for task in tasks] == ["bulk-1", "bulk-2"]
+    assert tasks[0].priority == 0
+    assert tasks[0].status == "pending"
+    assert tasks[0].feature_name == "misc"
+    assert tasks[1].priority == 7
+    assert tasks[1].status == "in_progress"
+    assert tasks[1].tests_required is False
+    assert len(TaskRepository.list_tasks()) == 2
+
+
+def test_add_tasks_bulk_empty_list():
+    """Test that an empty bulk insert is a no-op."""
+    assert TaskRepository.add_tasks_bulk([]) == []
+
+
+def test_add_tasks_bulk_nonexistent_feature():
+    """Test that bulk insert rejects unknown features before writing."""
+    with pytest.raises(ValueError, match="Feature 'missing' does not exist"):
+        TaskRepository.add_tasks_bulk(
+            [
+                {"name": "ok", "description": "Ok", "specification": "Spec"},
+                {
+                    "name": "bad",
+                    "description": "Bad",
+                    "specification": "Spec",
+                    "feature_name": "missing",
+                },
+            ]
+        )
+
+    assert TaskRepository.list_tasks() == []
+
+
+def test_add_tasks_bulk_duplicate_name():
+    """Test that bulk insert reports duplicate task names."""
+    TaskRepository.add_task("dup", "Existing", specification="Spec")
+
+    with pytest.raises(ValueError, match="Task with name 'dup' already exists"):
+        TaskRepository.add_tasks_bulk(
+            [
+                {"name": "new", "description": "New", "specification": "Spec"},
+                {"name": "dup", "description": "Again", "specification": "Spec"},
+            ]
+        )
+
+    # The whole batch is rejected before anything is written
+    assert [task.name for task in TaskRepository.list_tasks()] == ["dup"]
+
+
+def test_add_tasks_bulk_duplicate_name_within_batch():
+    """Test that bulk insert reports a name repeated inside the batch."""
+    with pytest.raises(ValueError, match="Task with name 'twice' already exists"):
+        TaskRepository.add_tasks_bulk(
+            [
+                {"name": "twice", "description": "One", "specification": "Spec"},
+                {"name": "twice", "description": "Two", "specification": "Spec"},
+            ]
+        )
+
+    assert TaskRepository.list_tasks() == []
@@ -2,18 +2,13 @@
 Tests for complete_task tool.
 """
 
-from pathlib import Path
-
 import pytest
 
-import tasktree.core.database as db
-from tasktree.core.database import TaskRepository
+from tasktree.core.database import DependencyRepository, TaskRepository
 
 
-def test_complete_task_success(test_db: Path, monkeypatch):
+def test_complete_task_success():
     """Test completing a task successfully."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create a task
     task = TaskRepository.add_task(
         name="test-task",
@@ -32,10 +27,8 @@ def test_complete_task_success(test_db: Path, monkeypatch):
     assert completed_task.status == "completed"
 
 
-def test_complete_task_from_pending(test_db: Path, monkeypatch):
+def test_complete_task_from_pending():
     """Test completing a task that is in pending status."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create a pending task
     task = TaskRepository.add_task(
         name="pending-task",
@@ -52,34 +45,21 @@ def test_complete_task_from_pending(test_db: Path, monkeypatch):
     assert completed_task.status == "completed"
 
 
-def test_complete_task_nonexistent(test_db: Path, monkeypatch):
+def test_complete_task_nonexistent():
     """Test completing a task that doesn't exist."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     result = TaskRepository.complete_task("nonexistent-task")
     assert result is None
 
 
-def test_complete_task_empty_name(test_db: Path, monkeypatch):
-    """Test completing a task with empty name."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
+@pytest.mark.parametrize("bad_name", ["", "   "])
+def test_complete_task_blank_name(bad_name):
+    """Test completing a task with an empty or whitespace-only name."""
     with pytest.raises(ValueError, match="Task name cannot be empty"):
-        TaskRepository.complete_task("")
-
+        TaskRepository.complete_task(bad_name)
 
-def test_complete_task_whitespace_name(test_db: Path, monkeypatch):
-    """Test completing a task with whitespace-only name."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
-    with pytest.raises(ValueError, match="Task name cannot be empty"):
-        TaskRepository.complete_task("   ")
 
-
-def test_complete_task_twice(test_db: Path, monkeypatch):
+def test_complete_task_twice():
     """Test completing a task that is already completed."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create and complete a task
     TaskRepository.add_task(
         name="already-done",
@@ -95,25 +75,25 @@ def test_complete_task_twice(test_db: Path, monkeypatch):
     assert second_completion.status == "completed"
 
 
-def test_complete_task_with_dependencies(test_db: Path, monkeypatch):
+def test_complete_task_with_dependencies():
     """Test completing a task that has dependent tasks."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create tasks with dependencies
-    TaskRepository.add_task(
-        name="dependency-task",
-        description="Task that others depend on",
-        specification="Dependency spec",
-    )
-    TaskRepository.add_task(
-        name="dependent-task",
-        description="Task that depends on another",
-        specification="Dependent spec",
+    TaskRepository.add_tasks_bulk(
+        [
+            {
+                "name": "dependency-task",
+                "description": "Task that others depend on",
+                "specification": "Dependency spec",
+            },
+            {
+                "name": "dependent-task",
+                "description": "Task that depends on another",
+                "specification": "Dependent spec",
+            },
+        ]
     )
 
     # Add dependency
-    from tasktree.core.database import DependencyRepository
-
     DependencyRepository.add_dependency(
         task_name="dependent-task", depends_on_task_name="dependency-task"
     )
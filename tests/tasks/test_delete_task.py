@@ -2,28 +2,12 @@
 Tests for the delete_task tool including cascading dependency cleanup.
 """
 
-from pathlib import Path
-
 import pytest
 
 from tasktree.core.database import DependencyRepository, TaskRepository
 
 
-@pytest.fixture
-def mock_db_path(test_db: Path, monkeypatch):
-    """
-    Mock the DB_PATH to use the test database.
-
-    This fixture modifies the database.DB_PATH to point to the test database,
-    ensuring all repository operations use the isolated test database.
-    """
-    import tasktree.core.database as db_module
-
-    monkeypatch.setattr(db_module, "DB_PATH", test_db)
-    return test_db
-
-
-def test_delete_task_basic(mock_db_path):
+def test_delete_task_basic():
     """Test deleting a task with no dependencies."""
     # Create a task
     TaskRepository.add_task("task-to-delete", "Task to delete", specification="Spec")
@@ -41,26 +25,21 @@ def test_delete_task_basic(mock_db_path):
     assert task is None
 
 
-def test_delete_task_nonexistent(mock_db_path):
+def test_delete_task_nonexistent():
     """Test deleting a task that doesn't exist returns False."""
     # Try to delete a task that doesn't exist
     deleted = TaskRepository.delete_task("nonexistent-task")
     assert deleted is False
 
 
-def test_delete_task_empty_name(mock_db_path):
-    """Test that deleting a task with empty name raises ValueError."""
-    with pytest.raises(ValueError, match="cannot be empty"):
-        TaskRepository.delete_task("")
-
-
-def test_delete_task_whitespace_name(mock_db_path):
-    """Test that deleting a task with whitespace-only name raises ValueError."""
+@pytest.mark.parametrize("bad_name", ["", "   "])
+def test_delete_task_blank_name(bad_name):
+    """Test that deleting a task with an empty or whitespace-only name raises ValueError."""
     with pytest.raises(ValueError, match="cannot be empty"):
-        TaskRepository.delete_task("   ")
+        TaskRepository.delete_task(bad_name)
 
 
-def test_delete_task_with_outgoing_dependencies(mock_db_path):
+def test_delete_task_with_outgoing_dependencies():
     """Test deleting a task that depends on other tasks (has outgoing dependencies)."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -84,7 +63,7 @@ def test_delete_task_with_outgoing_dependencies(mock_db_path):
     assert len(deps) == 0
 
 
-def test_delete_task_with_incoming_dependencies(mock_db_path):
+def test_delete_task_with_incoming_dependencies():
     """Test deleting a task that other tasks depend on (has incoming dependencies)."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -108,7 +87,7 @@ def test_delete_task_with_incoming_dependencies(mock_db_path):
     assert len(deps) == 0
 
 
-def test_delete_task_with_multiple_outgoing_dependencies(mock_db_path):
+def test_delete_task_with_multiple_outgoing_dependencies():
     """Test deleting a task that depends on multiple other tasks."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -139,7 +118,7 @@ def test_delete_task_with_multiple_outgoing_dependencies(mock_db_path):
     assert len(deps) == 0
 
 
-def test_delete_task_with_multiple_incoming_dependencies(mock_db_path):
+def test_delete_task_with_multiple_incoming_dependencies():
     """Test deleting a task that multiple other tasks depend on."""
     # Create tasks
     TaskRepository.add_task("base-task", "Base Task", specification="Spec")
@@ -173,7 +152,7 @@ def test_delete_task_with_multiple_incoming_dependencies(mock_db_path):
     assert len(deps) == 0
 
 
-def test_delete_task_in_dependency_chain(mock_db_path):
+def test_delete_task_in_dependency_chain():
     """Test deleting a task in the middle of a dependency chain."""
     # Create a chain: task-c depends on task-b, task-b depends on task-a
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -203,7 +182,7 @@ def test_delete_task_in_dependency_chain(mock_db_path):
     assert len(deps) == 0
 
 
-def test_delete_task_in_complex_graph(mock_db_path):
+def test_delete_task_in_complex_graph():
     """Test deleting a task in a complex dependency graph."""
     # Create a diamond pattern:
     # task-d depends on task-b and task-c
@@ -240,7 +219,7 @@ def test_delete_task_in_complex_graph(mock_db_path):
     assert len(deps) == 2  # Only task-d -> task-b and task-d -> task-c remain
 
 
-def test_delete_task_with_different_statuses(mock_db_path):
+def test_delete_task_with_different_statuses():
     """Test deleting tasks with different status values."""
     statuses = ["pending", "in_progress", "completed", "blocked"]
 
@@ -258,7 +237,7 @@ def test_delete_task_with_different_statuses(mock_db_path):
         assert TaskRepository.get_task(task_name) is None
 
 
-def test_delete_task_affects_available_tasks(mock_db_path):
+def test_delete_task_affects_available_tasks():
     """Test that deleting a task affects the available tasks list."""
     # Create tasks with dependencies
     TaskRepository.add_task("task-a", "Task A", specification="Spec", status="pending")
@@ -281,7 +260,7 @@ def test_delete_task_affects_available_tasks(mock_db_path):
     assert available[0].name == "task-b"
 
 
-def test_delete_multiple_tasks_in_sequence(mock_db_path):
+def test_delete_multiple_tasks_in_sequence():
     """Test deleting multiple tasks in sequence."""
     # Create multiple tasks
     task_names = [f"task-{i}" for i in range(5)]
@@ -299,7 +278,7 @@ def test_delete_multiple_tasks_in_sequence(mock_db_path):
     assert len(tasks) == 0
 
 
-def test_delete_task_and_verify_list_count(mock_db_path):
+def test_delete_task_and_verify_list_count():
     """Test that deleting a task updates the task count correctly."""
     # Create tasks
     TaskRepository.add_task("task-1", "Task 1", specification="Spec")
@@ -319,7 +298,7 @@ def test_delete_task_and_verify_list_count(mock_db_path):
     assert all(task.name != "task-2" for task in tasks)
 
 
-def test_delete_task_with_bidirectional_dependencies(mock_db_path):
+def test_delete_task_with_bidirectional_dependencies():
     """Test deleting a task that has both incoming and outgoing dependencies."""
     # Create tasks: A <- B <- C, B <- D
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -353,7 +332,7 @@ def test_delete_task_with_bidirectional_dependencies(mock_db_path):
     assert len(deps) == 0
 
 
-def test_delete_task_idempotency(mock_db_path):
+def test_delete_task_idempotency():
     """Test that deleting a task multiple times is safe."""
     # Create a task
     TaskRepository.add_task("task-to-delete", "Task to delete", specification="Spec")
@@ -367,7 +346,7 @@ def test_delete_task_idempotency(mock_db_path):
     assert deleted is False
 
 
-def test_delete_task_preserves_other_dependencies(mock_db_path):
+def test_delete_task_preserves_other_dependencies():
     """Test that deleting a task doesn't affect unrelated dependencies."""
     # Create tasks
     TaskRepository.add_task("task-a", "Task A", specification="Spec")
@@ -389,7 +368,7 @@ def test_delete_task_preserves_other_dependencies(mock_db_path):
     assert deps[0].depends_on_task_name == "task-c"
 
 
-def test_delete_task_special_characters(mock_db_path):
+def test_delete_task_special_characters():
     """Test deleting tasks with special characters in names."""
     special_names = [
         "task-with-dashes",
@@ -405,7 +384,7 @@ def test_delete_task_special_characters(mock_db_path):
         assert TaskRepository.get_task(name) is None
 
 
-def test_delete_task_with_specification_field(mock_db_path):
+def test_delete_task_with_specification_field():
     """Test deleting a task that has specification field populated."""
     # Create a task with specification
     TaskRepository.add_task(
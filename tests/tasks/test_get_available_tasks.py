@@ -13,27 +13,22 @@ import pytest
 from tasktree.core.database import DependencyRepository, TaskRepository
 
 
-@pytest.fixture
-def mock_db_path(test_db, monkeypatch):
-    """
-    Mock the DB_PATH to use the test database.
-
-    This fixture modifies the database.DB_PATH to point to the test database,
-    ensuring all repository operations use the isolated test database.
-    """
-    import tasktree.core.database as db_module
+def advance_and_assert(completed: list[str], expected_names: list[str]) -> None:
+    """Complete the given tasks, then check the available tasks in order."""
+    for name in completed:
+        TaskRepository.update_task(name, status="completed")
 
-    monkeypatch.setattr(db_module, "DB_PATH", test_db)
-    return test_db
+    available = DependencyRepository.get_available_tasks()
+    assert [task.name for task in available] == expected_names
 
 
-def test_get_available_tasks_empty_database(mock_db_path):
+def test_get_available_tasks_empty_database():
     """Test that get_available_tasks returns empty list when no tasks exist."""
     available = DependencyRepository.get_available_tasks()
     assert len(available) == 0
 
 
-def test_get_available_tasks_no_dependencies(mock_db_path):
+def test_get_available_tasks_no_dependencies():
     """Test that all pending tasks are available when there are no dependencies."""
     # Create tasks with different priorities
     TaskRepository.add_task(
@@ -72,7 +67,7 @@ def test_get_available_tasks_no_dependencies(mock_db_path):
     assert available[2].priority == 1
 
 
-def test_get_available_tasks_excludes_completed(mock_db_path):
+def test_get_available_tasks_excludes_completed():
     """Test that only pending tasks are available."""
     TaskRepository.add_task(
         "completed-task", "Already done", specification="Spec", status="completed"
@@ -90,53 +85,39 @@ def test_get_available_tasks_excludes_completed(mock_db_path):
     available = DependencyRepository.get_available_tasks()
 
     # Only pending tasks should be available
-    assert len(available) == 1
-    task_names = {task.name for task in available}
-    assert "pending-task" in task_names
-    assert "completed-task" not in task_names
-    assert "in-progress-task" not in task_names
+    assert [task.name for task in available] == ["pending-task"]
 
 
-def test_get_available_tasks_simple_dependency_chain(mock_db_path):
-    """Test that tasks with uncompleted dependencies are not available."""
-    # Create a simple chain: task-a -> task-b -> task-c
-    TaskRepository.add_task(
-        "task-a", "First task", specification="Spec", status="pending"
-    )
-    TaskRepository.add_task(
-        "task-b", "Second task", specification="Spec", status="pending"
-    )
-    TaskRepository.add_task(
-        "task-c", "Third task", specification="Spec", status="pending"
-    )
-
-    # task-b depends on task-a, task-c depends on task-b
-    DependencyRepository.add_dependency("task-b", "task-a")
-    DependencyRepository.add_dependency("task-c", "task-b")
-
-    # Only task-a should be available (no dependencies)
-    available = DependencyRepository.get_available_tasks()
-    assert len(available) == 1
-    assert available[0].name == "task-a"
-
-    # Complete task-a
-    TaskRepository.update_task("task-a", status="completed")
-
-    # Now task-b should be available
-    available = DependencyRepository.get_available_tasks()
-    assert len(available) == 1
-    assert available[0].name == "task-b"
-
-    # Complete task-b
-    TaskRepository.update_task("task-b", status="completed")
-
-    # Now task-c should be available
-    available = DependencyRepository.get_available_tasks()
-    assert len(available) == 1
-    assert available[0].name == "task-c"
-
-
-def test_get_available_tasks_multiple_dependencies(mock_db_path):
+@pytest.fixture
+def task_chain() -> None:
+    """Seed the chain task-a <- task-b <- task-c, all pending."""
+    TaskRepository.add_tasks_bulk(
+        [
+            {"name": name, "description": name, "specification": "Spec"}
+            for name in ("task-a", "task-b", "task-c")
+        ]
+    )
+    DependencyRepository.add_dependencies_bulk(
+        [("task-b", "task-a"), ("task-c", "task-b")]
+    )
+
+
+@pytest.mark.parametrize(
+    ("completed", "expected_names"),
+    [
+        ([], ["task-a"]),
+        (["task-a"], ["task-b"]),
+        (["task-a", "task-b"], ["task-c"]),
+    ],
+)
+def test_get_available_tasks_simple_dependency_chain(
+    task_chain, completed, expected_names
+):
+    """Test that completing each link makes exactly the next one available."""
+    advance_and_assert(completed, expected_names)
+
+
+def test_get_available_tasks_multiple_dependencies():
     """Test that tasks with multiple dependencies are only available when all are completed."""
     # Create tasks
     TaskRepository.add_task(
@@ -156,18 +137,15 @@ def test_get_available_tasks_multiple_dependencies(mock_db_path):
     )
 
     # main-task depends on all three deps
-    DependencyRepository.add_dependency("main-task", "dep-1")
-    DependencyRepository.add_dependency("main-task", "dep-2")
-    DependencyRepository.add_dependency("main-task", "dep-3")
+    DependencyRepository.add_dependencies_bulk(
+        [("main-task", "dep-1"), ("main-task", "dep-2"), ("main-task", "dep-3")]
+    )
 
     # Initially, only the dependencies should be available
     available = DependencyRepository.get_available_tasks()
-    assert len(available) == 3
-    task_names = {task.name for task in available}
-    assert "dep-1" in task_names
-    assert "dep-2" in task_names
-    assert "dep-3" in task_names
-    assert "main-task" not in task_names
+    # The deps share a priority and can share a created_at second, so their
+    # relative order is not fixed
+    assert {task.name for task in available} == {"dep-1", "dep-2", "dep-3"}
 
     # Complete two of the dependencies
     TaskRepository.update_task("dep-1", status="completed")
@@ -187,23 +165,19 @@ def test_get_available_tasks_multiple_dependencies(mock_db_path):
     assert available[0].name == "main-task"
 
 
-def test_get_available_tasks_priority_ordering(mock_db_path):
+def test_get_available_tasks_priority_ordering():
     """Test that available tasks are ordered by priority (highest first)."""
     # Create tasks with different priorities, all available
-    TaskRepository.add_task(
-        "priority-1", "Priority 1", specification="Spec", priority=1
-    )
-    TaskRepository.add_task(
-        "priority-10", "Priority 10", specification="Spec", priority=10
-    )
-    TaskRepository.add_task(
-        "priority-5", "Priority 5", specification="Spec", priority=5
-    )
-    TaskRepository.add_task(
-        "priority-7", "Priority 7", specification="Spec", priority=7
-    )
-    TaskRepository.add_task(
-        "priority-3", "Priority 3", specification="Spec", priority=3
+    TaskRepository.add_tasks_bulk(
+        [
+            {
+                "name": f"priority-{priority}",
+                "description": f"Priority {priority}",
+                "specification": "Spec",
+                "priority": priority,
+            }
+            for priority in (1, 10, 5, 7, 3)
+        ]
     )
 
     available = DependencyRepository.get_available_tasks()
@@ -217,7 +191,7 @@ def test_get_available_tasks_priority_ordering(mock_db_path):
     assert available[4].priority == 1
 
 
-def test_get_available_tasks_created_at_secondary_sort(mock_db_path):
+def test_get_available_tasks_created_at_secondary_sort():
     """Test that tasks with same priority are ordered by created_at (oldest first)."""
     # Create tasks with same priority
     TaskRepository.add_task("task-1", "First created", specification="Spec", priority=5)
@@ -235,7 +209,7 @@ def test_get_available_tasks_created_at_secondary_sort(mock_db_path):
     assert available[2].name == "task-3"
 
 
-def test_get_available_tasks_complex_dependency_graph(mock_db_path):
+def test_get_available_tasks_complex_dependency_graph():
     """Test a complex dependency graph with multiple branches."""
     # Create a dependency graph:
     #       base
@@ -257,36 +231,26 @@ def test_get_available_tasks_complex_dependency_graph(mock_db_path):
         "top", "Top task", specification="Spec", status="pending", priority=9
     )
 
-    DependencyRepository.add_dependency("left", "base")
-    DependencyRepository.add_dependency("right", "base")
-    DependencyRepository.add_dependency("top", "left")
-    DependencyRepository.add_dependency("top", "right")
-
-    # Both left and right should be available (base is completed)
-    available = DependencyRepository.get_available_tasks()
-    assert len(available) == 2
-    # Should be ordered by priority: left (10) before right (8)
-    assert available[0].name == "left"
-    assert available[1].name == "right"
-
-    # Complete left branch
-    TaskRepository.update_task("left", status="completed")
-
-    # Only right should be available now
-    available = DependencyRepository.get_available_tasks()
-    assert len(available) == 1
-    assert available[0].name == "right"
-
-    # Complete right branch
-    TaskRepository.update_task("right", status="completed")
+    DependencyRepository.add_dependencies_bulk(
+        [
+            ("left", "base"),
+            ("right", "base"),
+            ("top", "left"),
+            ("top", "right"),
+        ]
+    )
 
-    # Now top should be available
-    available = DependencyRepository.get_available_tasks()
-    assert len(available) == 1
-    assert available[0].name == "top"
+    # left (10) and right (8) are available once base is completed; top only
+    # becomes available after both branches are done
+    for completed, expected in [
+        ([], ["left", "right"]),
+        (["left"], ["right"]),
+        (["right"], ["top"]),
+    ]:
+        advance_and_assert(completed, expected)
 
 
-def test_get_available_tasks_in_progress_dependencies(mock_db_path):
+def test_get_available_tasks_in_progress_dependencies():
     """Test that tasks with in_progress dependencies are not available."""
     TaskRepository.add_task(
         "dep-task", "Dependency", specification="Spec", status="in_progress"
@@ -302,7 +266,7 @@ def test_get_available_tasks_in_progress_dependencies(mock_db_path):
     assert len(available) == 0
 
 
-def test_get_available_tasks_no_uncompleted_dependencies_only(mock_db_path):
+def test_get_available_tasks_no_uncompleted_dependencies_only():
     """Test that a task with some completed and some uncompleted dependencies is not available."""
     TaskRepository.add_task(
         "completed-dep",
@@ -322,12 +286,10 @@ def test_get_available_tasks_no_uncompleted_dependencies_only(mock_db_path):
 
     # main-task should not be available (pending-dep is not completed)
     available = DependencyRepository.get_available_tasks()
-    task_names = {task.name for task in available}
-    assert "pending-dep" in task_names
-    assert "main-task" not in task_names
+    assert [task.name for task in available] == ["pending-dep"]
 
 
-def test_get_available_tasks_handles_orphaned_tasks(mock_db_path):
+def test_get_available_tasks_handles_orphaned_tasks():
     """Test that only pending orphans are available."""
     TaskRepository.add_task(
         "orphan-1", "Orphan task 1", specification="Spec", status="pending", priority=5
@@ -354,15 +316,11 @@ def test_get_available_tasks_handles_orphaned_tasks(mock_db_path):
 
     # Only pending orphans and dep should be available
     available = DependencyRepository.get_available_tasks()
-    assert len(available) == 2
-    task_names = {task.name for task in available}
-    assert "orphan-1" in task_names
-    assert "dep" in task_names
-    assert "with-deps" not in task_names
-    assert "orphan-2" not in task_names
+    # orphan-1 (priority 5) sorts ahead of dep (priority 1)
+    assert [task.name for task in available] == ["orphan-1", "dep"]
 
 
-def test_get_available_tasks_all_completed(mock_db_path):
+def test_get_available_tasks_all_completed():
     """Test that when all tasks are completed, no tasks are available."""
     TaskRepository.add_task(
         "task-1", "Task 1", specification="Spec", status="completed"
@@ -376,3 +334,14 @@ def test_get_available_tasks_all_completed(mock_db_path):
 
     available = DependencyRepository.get_available_tasks()
     assert len(available) == 0
+
+
+def test_get_available_tasks_uses_status_index(test_db_connection):
+    """Test that the available-tasks query searches by status via the index."""
+    plan = " ".join(
+        row["detail"]
+        for row in test_db_connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM v_available_tasks"
+        )
+    )
+    assert "idx_tasks_status_priority" in plan
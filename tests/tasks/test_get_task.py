@@ -2,48 +2,51 @@
 Tests for the get_task tool including valid and invalid task names.
 """
 
-from pathlib import Path
-
 import pytest
 
 from tasktree.core.database import TaskRepository
 
 
-@pytest.fixture
-def mock_db_path(test_db: Path, monkeypatch):
-    """
-    Mock the DB_PATH to use the test database.
-
-    This fixture modifies the database.DB_PATH to point to the test database,
-    ensuring all repository operations use the isolated test database.
-    """
-    import tasktree.core.database as db_module
-
-    monkeypatch.setattr(db_module, "DB_PATH", test_db)
-    return test_db
-
-
-def test_get_task_valid_task(mock_db_path):
-    """Test getting a task that exists in the database."""
-    # Create a task
-    TaskRepository.add_task(
-        name="existing-task",
-        description="A task that exists",
-        specification="A specification",
-        priority=5,
+@pytest.mark.parametrize(
+    ("task_kwargs", "expected"),
+    [
+        pytest.param(
+            {"description": "A task that exists", "priority": 5},
+            {"priority": 5, "status": "pending"},
+            id="valid",
+        ),
+        pytest.param(
+            {
+                "description": "Complete description",
+                "priority": 8,
+                "status": "in_progress",
+            },
+            {"priority": 8, "status": "in_progress"},
+            id="all-fields",
+        ),
+        pytest.param(
+            {"description": "Minimal description"},
+            {"priority": 0, "status": "pending"},
+            id="minimal-fields",
+        ),
+    ],
+)
+def test_get_task_returns_created_task(task_kwargs, expected):
+    """Test that get_task returns exactly what add_task created."""
+    created = TaskRepository.add_task(
+        name="round-trip-task", specification="A specification", **task_kwargs
     )
 
-    # Get the task
-    task = TaskRepository.get_task("existing-task")
+    task = TaskRepository.get_task("round-trip-task")
 
-    # Verify the task was retrieved
-    assert task is not None
-    assert task.name == "existing-task"
-    assert task.description == "A task that exists"
-    assert task.priority == 5
+    assert task == created
+    assert task.description == task_kwargs["description"]
+    assert task.specification == "A specification"
+    for field, value in expected.items():
+        assert getattr(task, field) == value
 
 
-def test_get_task_nonexistent_task(mock_db_path):
+def test_get_task_nonexistent_task():
     """Test getting a task that does not exist returns None."""
     # Try to get a task that doesn't exist
     task = TaskRepository.get_task("nonexistent-task")
@@ -52,86 +55,14 @@ def test_get_task_nonexistent_task(mock_db_path):
     assert task is None
 
 
-def test_get_task_empty_string(mock_db_path):
-    """Test that getting a task with empty string name raises ValueError."""
+@pytest.mark.parametrize("name", ["", "   "], ids=["empty", "whitespace-only"])
+def test_get_task_blank_name(name):
+    """Test that getting a task with a blank name raises ValueError."""
     with pytest.raises(ValueError, match="Task name cannot be empty"):
-        TaskRepository.get_task("")
-
-
-def test_get_task_whitespace_only(mock_db_path):
-    """Test that getting a task with whitespace-only name raises ValueError."""
-    with pytest.raises(ValueError, match="Task name cannot be empty"):
-        TaskRepository.get_task("   ")
-
+        TaskRepository.get_task(name)
 
-def test_get_task_with_all_fields(mock_db_path):
-    """Test getting a task with all fields populated."""
-    # Create a task with all fields
-    TaskRepository.add_task(
-        name="full-task",
-        description="Complete description",
-        priority=8,
-        status="in_progress",
-        specification="Detailed implementation notes",
-    )
-
-    # Get the task
-    task = TaskRepository.get_task("full-task")
 
-    # Verify all fields are present and correct
-    assert task is not None
-    assert task.name == "full-task"
-    assert task.description == "Complete description"
-    assert task.priority == 8
-    assert task.status == "in_progress"
-    assert task.specification == "Detailed implementation notes"
-    assert hasattr(task, "created_at")
-    assert hasattr(task, "started_at")
-    assert hasattr(task, "completed_at")
-
-
-def test_get_task_with_minimal_fields(mock_db_path):
-    """Test getting a task with minimal fields (defaults)."""
-    # Create a task with minimal parameters
-    TaskRepository.add_task(
-        name="minimal-task",
-        description="Minimal description",
-        specification="A minimal specification",
-    )
-
-    # Get the task
-    task = TaskRepository.get_task("minimal-task")
-
-    # Verify defaults are applied
-    assert task is not None
-    assert task.name == "minimal-task"
-    assert task.description == "Minimal description"
-    assert task.priority == 0
-    assert task.status == "pending"
-    assert task.specification == "A minimal specification"
-
-
-def test_get_task_immediately_after_creation(mock_db_path):
-    """Test that get_task works immediately after creating a task."""
-    # Create and immediately retrieve
-    created = TaskRepository.add_task(
-        name="immediate-task",
-        description="Created just now",
-        specification="A specification",
-        priority=7,
-    )
-
-    retrieved = TaskRepository.get_task("immediate-task")
-
-    # Should match the created task
-    assert retrieved is not None
-    assert retrieved.name == created.name
-    assert retrieved.description == created.description
-    assert retrieved.priority == created.priority
-    assert retrieved.created_at == created.created_at
-
-
-def test_get_task_after_update(mock_db_path):
+def test_get_task_after_update():
     """Test getting a task after it has been updated."""
     # Create a task
     TaskRepository.add_task(
@@ -157,7 +88,7 @@ def test_get_task_after_update(mock_db_path):
     assert task.priority == 7
 
 
-def test_get_task_completed_task(mock_db_path):
+def test_get_task_completed_task():
     """Test getting a completed task."""
     # Create and complete a task
     TaskRepository.add_task(
@@ -176,16 +107,20 @@ def test_get_task_completed_task(mock_db_path):
     assert task.completed_at is not None
 
 
-def test_get_task_multiple_tasks_exist(mock_db_path):
+def test_get_task_multiple_tasks_exist():
     """Test getting a specific task when multiple tasks exist."""
     # Create multiple tasks
-    for i in range(5):
-        TaskRepository.add_task(
-            name=f"task-{i}",
-            description=f"Task number {i}",
-            priority=i,
-            specification="A specification",
-        )
+    TaskRepository.add_tasks_bulk(
+        [
+            {
+                "name": f"task-{i}",
+                "description": f"Task number {i}",
+                "priority": i,
+                "specification": "A specification",
+            }
+            for i in range(5)
+        ]
+    )
 
     # Get a specific task
     task = TaskRepository.get_task("task-2")
@@ -197,7 +132,7 @@ def test_get_task_multiple_tasks_exist(mock_db_path):
     assert task.priority == 2
 
 
-def test_get_task_after_delete_returns_none(mock_db_path):
+def test_get_task_after_delete_returns_none():
     """Test that getting a deleted task returns None."""
     # Create a task
     TaskRepository.add_task(
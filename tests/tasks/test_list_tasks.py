@@ -2,35 +2,20 @@
 Tests for the list_tasks tool including status/priority filtering and ordering.
 """
 
-from pathlib import Path
-
 import pytest
 
+import tasktree.core.database as db
 from tasktree.core.database import TaskRepository
 
 
-@pytest.fixture
-def mock_db_path(test_db: Path, monkeypatch):
-    """
-    Mock the DB_PATH to use the test database.
-
-    This fixture modifies the database.DB_PATH to point to the test database,
-    ensuring all repository operations use the isolated test database.
-    """
-    import tasktree.core.database as db_module
-
-    monkeypatch.setattr(db_module, "DB_PATH", test_db)
-    return test_db
-
-
-def test_list_tasks_empty_database(mock_db_path):
+def test_list_tasks_empty_database():
     """Test listing tasks when the database is empty."""
     tasks = TaskRepository.list_tasks()
     assert tasks == []
     assert len(tasks) == 0
 
 
-def test_list_tasks_single_task(mock_db_path):
+def test_list_tasks_single_task():
     """Test listing tasks with a single task in the database."""
     TaskRepository.add_task(
         "single-task", "A single task", specification="Spec", priority=5
@@ -43,17 +28,25 @@ def test_list_tasks_single_task(mock_db_path):
     assert tasks[0].priority == 5
 
 
-def test_list_tasks_multiple_tasks(mock_db_path):
+def test_list_tasks_multiple_tasks():
     """Test listing multiple tasks."""
-    TaskRepository.add_task("task-1", "First task", specification="Spec", priority=1)
-    TaskRepository.add_task("task-2", "Second task", specification="Spec", priority=2)
-    TaskRepository.add_task("task-3", "Third task", specification="Spec", priority=3)
+    TaskRepository.add_tasks_bulk(
+        [
+            {
+                "name": f"task-{i}",
+                "description": f"{label} task",
+                "specification": "Spec",
+                "priority": i,
+            }
+            for i, label in enumerate(["First", "Second", "Third"], start=1)
+        ]
+    )
 
     tasks = TaskRepository.list_tasks()
     assert len(tasks) == 3
 
 
-def test_list_tasks_ordering_by_priority_descending(mock_db_path):
+def test_list_tasks_ordering_by_priority_descending():
     """Test that tasks are ordered by priority in descending order."""
     TaskRepository.add_task("low", "Low priority", specification="Spec", priority=1)
     TaskRepository.add_task("high", "High priority", specification="Spec", priority=10)
@@ -70,7 +63,7 @@ def test_list_tasks_ordering_by_priority_descending(mock_db_path):
     assert tasks[2].priority == 1
 
 
-def test_list_tasks_ordering_by_created_at_when_priority_same(mock_db_path):
+def test_list_tasks_ordering_by_created_at_when_priority_same():
     """Test that tasks with same priority are ordered by created_at ascending."""
     # Add tasks with same priority in specific order
     TaskRepository.add_task("first", "First created", specification="Spec", priority=5)
@@ -87,7 +80,7 @@ def test_list_tasks_ordering_by_created_at_when_priority_same(mock_db_path):
     assert tasks[2].name == "third"
 
 
-def test_list_tasks_filter_by_status_pending(mock_db_path):
+def test_list_tasks_filter_by_status_pending():
     """Test filtering tasks by status='pending'."""
     TaskRepository.add_task(
         "pending-1", "Pending task 1", specification="Spec", status="pending"
@@ -109,7 +102,7 @@ def test_list_tasks_filter_by_status_pending(mock_db_path):
     assert {task.name for task in tasks} == {"pending-1", "pending-2"}
 
 
-def test_list_tasks_filter_by_status_in_progress(mock_db_path):
+def test_list_tasks_filter_by_status_in_progress():
     """Test filtering tasks by status='in_progress'."""
     TaskRepository.add_task(
         "pending-1", "Pending task", specification="Spec", status="pending"
@@ -130,7 +123,7 @@ def test_list_tasks_filter_by_status_in_progress(mock_db_path):
     assert all(task.status == "in_progress" for task in tasks)
 
 
-def test_list_tasks_filter_by_status_completed(mock_db_path):
+def test_list_tasks_filter_by_status_completed():
     """Test filtering tasks by status='completed'."""
     TaskRepository.add_task(
         "pending-1", "Pending task", specification="Spec", status="pending"
@@ -151,7 +144,7 @@ def test_list_tasks_filter_by_status_completed(mock_db_path):
     assert all(task.status == "completed" for task in tasks)
 
 
-def test_list_tasks_filter_by_priority_min(mock_db_path):
+def test_list_tasks_filter_by_priority_min():
     """Test filtering tasks by minimum priority."""
     TaskRepository.add_task("low", "Low priority", specification="Spec", priority=2)
     TaskRepository.add_task("mid", "Mid priority", specification="Spec", priority=5)
@@ -165,7 +158,7 @@ def test_list_tasks_filter_by_priority_min(mock_db_path):
     assert {task.name for task in tasks} == {"mid", "high", "max"}
 
 
-def test_list_tasks_filter_by_priority_min_zero(mock_db_path):
+def test_list_tasks_filter_by_priority_min_zero():
     """Test filtering with priority_min=0 returns all tasks."""
     TaskRepository.add_task("zero", "Zero priority", specification="Spec", priority=0)
     TaskRepository.add_task("five", "Five priority", specification="Spec", priority=5)
@@ -177,7 +170,7 @@ def test_list_tasks_filter_by_priority_min_zero(mock_db_path):
     assert all(task.priority >= 0 for task in tasks)
 
 
-def test_list_tasks_filter_by_priority_min_boundary(mock_db_path):
+def test_list_tasks_filter_by_priority_min_boundary():
     """Test filtering with priority_min at exact boundary."""
     TaskRepository.add_task(
         "below", "Below threshold", specification="Spec", priority=4
@@ -196,7 +189,7 @@ def test_list_tasks_filter_by_priority_min_boundary(mock_db_path):
     assert {task.name for task in tasks} == {"exactly", "above"}
 
 
-def test_list_tasks_filter_by_status_and_priority(mock_db_path):
+def test_list_tasks_filter_by_status_and_priority():
     """Test filtering by both status and priority_min."""
     TaskRepository.add_task(
         "pending-low", "Pending low", specification="Spec", status="pending", priority=2
@@ -231,7 +224,7 @@ def test_list_tasks_filter_by_status_and_priority(mock_db_path):
     assert tasks[0].priority == 8
 
 
-def test_list_tasks_filter_status_no_matches(mock_db_path):
+def test_list_tasks_filter_status_no_matches():
     """Test filtering by status with no matching tasks."""
     TaskRepository.add_task(
         "pending-1", "Pending task", specification="Spec", status="pending"
@@ -246,7 +239,7 @@ def test_list_tasks_filter_status_no_matches(mock_db_path):
     assert len(tasks) == 0
 
 
-def test_list_tasks_filter_priority_min_no_matches(mock_db_path):
+def test_list_tasks_filter_priority_min_no_matches():
     """Test filtering by priority_min with no matching tasks."""
     TaskRepository.add_task("low-1", "Low priority 1", specification="Spec", priority=1)
     TaskRepository.add_task("low-2", "Low priority 2", specification="Spec", priority=2)
@@ -257,7 +250,7 @@ def test_list_tasks_filter_priority_min_no_matches(mock_db_path):
     assert len(tasks) == 0
 
 
-def test_list_tasks_filter_combined_no_matches(mock_db_path):
+def test_list_tasks_filter_combined_no_matches():
     """Test filtering by both status and priority with no matches."""
     TaskRepository.add_task(
         "pending-low", "Pending low", specification="Spec", status="pending", priority=2
@@ -275,7 +268,7 @@ def test_list_tasks_filter_combined_no_matches(mock_db_path):
     assert tasks == []
 
 
-def test_list_tasks_ordering_with_status_filter(mock_db_path):
+def test_list_tasks_ordering_with_status_filter():
     """Test that ordering is maintained when filtering by status."""
     TaskRepository.add_task(
         "pending-low", "Pending low", specification="Spec", status="pending", priority=1
@@ -307,7 +300,7 @@ def test_list_tasks_ordering_with_status_filter(mock_db_path):
     assert tasks[2].name == "pending-low"
 
 
-def test_list_tasks_ordering_with_priority_filter(mock_db_path):
+def test_list_tasks_ordering_with_priority_filter():
     """Test that ordering is maintained when filtering by priority_min."""
     TaskRepository.add_task(
         "high-1", "High priority 1", specification="Spec", priority=10
@@ -327,7 +320,7 @@ def test_list_tasks_ordering_with_priority_filter(mock_db_path):
     assert tasks[2].priority == 5
 
 
-def test_list_tasks_all_fields_present(mock_db_path):
+def test_list_tasks_all_fields_present():
     """Test that all task fields are present in the returned tasks."""
     TaskRepository.add_task(
         name="full-task",
@@ -360,7 +353,7 @@ def test_list_tasks_all_fields_present(mock_db_path):
     assert task.status == "in_progress"
 
 
-def test_list_tasks_with_different_statuses(mock_db_path):
+def test_list_tasks_with_different_statuses():
     """Test listing tasks with various status values."""
     TaskRepository.add_task(
         "blocked", "Blocked task", specification="Spec", status="blocked"
@@ -391,9 +384,7 @@ def test_list_tasks_with_different_statuses(mock_db_path):
         (None, 7, 6),
     ],
 )
-def test_list_tasks_medium_dataset_filters(
-    mock_db_path, status_filter, priority_min, expected_count
-):
+def test_list_tasks_medium_dataset_filters(status_filter, priority_min, expected_count):
     """Test ordering and filtering against a medium-sized dataset."""
     statuses = ["pending", "in_progress", "completed"]
     for i in range(20):
@@ -412,7 +403,7 @@ def test_list_tasks_medium_dataset_filters(
         assert tasks[i].priority >= tasks[i + 1].priority
 
 
-def test_list_tasks_none_parameters(mock_db_path):
+def test_list_tasks_none_parameters():
     """Test that passing None for optional parameters works correctly."""
     TaskRepository.add_task("task-1", "Task 1", specification="Spec", priority=5)
     TaskRepository.add_task("task-2", "Task 2", specification="Spec", priority=3)
@@ -426,12 +417,10 @@ def test_list_tasks_none_parameters(mock_db_path):
     assert tasks[1].name == "task-2"
 
 
-def test_list_tasks_filter_by_feature_name(mock_db_path):
+def test_list_tasks_filter_by_feature_name():
     """Test filtering tasks by feature_name."""
     # Create test features first
-    from tasktree.core.database import get_db_connection
-
-    with get_db_connection() as conn:
+    with db.get_db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
             """
@@ -469,12 +458,10 @@ def test_list_tasks_filter_by_feature_name(mock_db_path):
     assert {task.name for task in tasks} == {"task-2", "task-4"}
 
 
-def test_list_tasks_filter_by_feature_name_no_matches(mock_db_path):
+def test_list_tasks_filter_by_feature_name_no_matches():
     """Test filtering by feature_name with no matching tasks."""
     # Create test features first
-    from tasktree.core.database import get_db_connection
-
-    with get_db_connection() as conn:
+    with db.get_db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
             """
@@ -498,12 +485,10 @@ def test_list_tasks_filter_by_feature_name_no_matches(mock_db_path):
     assert len(tasks) == 0
 
 
-def test_list_tasks_filter_by_feature_and_status(mock_db_path):
+def test_list_tasks_filter_by_feature_and_status():
     """Test filtering by both feature_name and status."""
     # Create test features first
-    from tasktree.core.database import get_db_connection
-
-    with get_db_connection() as conn:
+    with db.get_db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
             """
@@ -558,12 +543,10 @@ def test_list_tasks_filter_by_feature_and_status(mock_db_path):
     assert {task.name for task in tasks} == {"task-1", "task-4"}
 
 
-def test_list_tasks_filter_by_feature_priority_and_status(mock_db_path):
+def test_list_tasks_filter_by_feature_priority_and_status():
     """Test filtering by feature_name, priority_min, and status."""
     # Create test features first
-    from tasktree.core.database import get_db_connection
-
-    with get_db_connection() as conn:
+    with db.get_db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
             """
@@ -625,12 +608,10 @@ def test_list_tasks_filter_by_feature_priority_and_status(mock_db_path):
     assert tasks[0].priority == 8
 
 
-def test_list_tasks_filter_by_default_feature(mock_db_path):
+def test_list_tasks_filter_by_default_feature():
     """Test filtering tasks by the default feature."""
     # Create test features first
-    from tasktree.core.database import get_db_connection
-
-    with get_db_connection() as conn:
+    with db.get_db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
             """
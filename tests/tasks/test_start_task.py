@@ -2,18 +2,13 @@
 Tests for start_task tool.
 """
 
-from pathlib import Path
-
 import pytest
 
-import tasktree.core.database as db
 from tasktree.core.database import DependencyRepository, TaskRepository
 
 
-def test_start_task_success(test_db: Path, monkeypatch):
+def test_start_task_success():
     """Test starting a task successfully."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create a pending task
     task = TaskRepository.add_task(
         name="test-task",
@@ -32,10 +27,8 @@ def test_start_task_success(test_db: Path, monkeypatch):
     assert started_task.status == "in_progress"
 
 
-def test_start_task_from_completed(test_db: Path, monkeypatch):
+def test_start_task_from_completed():
     """Test starting a task that is already completed."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create a completed task
     TaskRepository.add_task(
         name="completed-task",
@@ -59,34 +52,21 @@ def test_start_task_from_completed(test_db: Path, monkeypatch):
     assert started_task.status == "in_progress"
 
 
-def test_start_task_nonexistent(test_db: Path, monkeypatch):
+def test_start_task_nonexistent():
     """Test starting a task that doesn't exist."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     result = TaskRepository.update_task(name="nonexistent-task", status="in_progress")
     assert result is None
 
 
-def test_start_task_empty_name(test_db: Path, monkeypatch):
-    """Test starting a task with empty name."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
-    with pytest.raises(ValueError, match="Task name cannot be empty"):
-        TaskRepository.update_task(name="", status="in_progress")
-
-
-def test_start_task_whitespace_name(test_db: Path, monkeypatch):
-    """Test starting a task with whitespace-only name."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
+@pytest.mark.parametrize("bad_name", ["", "   "])
+def test_start_task_blank_name(bad_name):
+    """Test starting a task with an empty or whitespace-only name."""
     with pytest.raises(ValueError, match="Task name cannot be empty"):
-        TaskRepository.update_task(name="   ", status="in_progress")
+        TaskRepository.update_task(name=bad_name, status="in_progress")
 
 
-def test_start_task_preserves_other_fields(test_db: Path, monkeypatch):
+def test_start_task_preserves_other_fields():
     """Test that starting a task preserves description, priority, and specification."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create a task with specific fields
     original_task = TaskRepository.add_task(
         name="preserve-test",
@@ -108,10 +88,8 @@ def test_start_task_preserves_other_fields(test_db: Path, monkeypatch):
     assert started_task.status == "in_progress"
 
 
-def test_start_task_with_dependencies(test_db: Path, monkeypatch):
+def test_start_task_with_dependencies():
     """Test starting a task that has dependencies."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create tasks with dependencies
     TaskRepository.add_task(
         name="dependency-task",
@@ -136,10 +114,8 @@ def test_start_task_with_dependencies(test_db: Path, monkeypatch):
     assert started.status == "in_progress"
 
 
-def test_start_task_makes_task_unavailable(test_db: Path, monkeypatch):
+def test_start_task_makes_task_unavailable():
     """Test that starting a task removes it from available tasks."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create a pending task
     TaskRepository.add_task(
         name="available-task", description="Available task", specification="Spec"
@@ -2,18 +2,13 @@
 Tests for the update_task tool including partial updates, specification field updates, and validation.
 """
 
-from pathlib import Path
-
 import pytest
 
-import tasktree.core.database as db
 from tasktree.core.database import TaskRepository
 
 
-def test_update_task_description_only(test_db: Path, monkeypatch):
+def test_update_task_description_only():
     """Test updating only the description field."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create a task
     TaskRepository.add_task(
         name="test-task",
@@ -35,10 +30,8 @@ def test_update_task_description_only(test_db: Path, monkeypatch):
     assert updated.status == "pending"  # Unchanged
 
 
-def test_update_task_priority_only(test_db: Path, monkeypatch):
+def test_update_task_priority_only():
     """Test updating only the priority field."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create a task
     TaskRepository.add_task(
         name="priority-task",
@@ -58,10 +51,8 @@ def test_update_task_priority_only(test_db: Path, monkeypatch):
     assert updated.description == "Test task"  # Unchanged
 
 
-def test_update_task_status_only(test_db: Path, monkeypatch):
+def test_update_task_status_only():
     """Test updating only the status field."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create a task
     TaskRepository.add_task(
         name="status-task",
@@ -81,10 +72,8 @@ def test_update_task_status_only(test_db: Path, monkeypatch):
     assert updated.started_at is not None  # Trigger should set this
 
 
-def test_update_task_specification_only(test_db: Path, monkeypatch):
+def test_update_task_specification_only():
     """Test updating only the specification field."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create a task without specification
     TaskRepository.add_task(
         name="details-task",
@@ -103,10 +92,8 @@ def test_update_task_specification_only(test_db: Path, monkeypatch):
     assert updated.description == "Test task"  # Unchanged
 
 
-def test_update_task_multiple_fields(test_db: Path, monkeypatch):
+def test_update_task_multiple_fields():
     """Test updating multiple fields at once."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create a task
     TaskRepository.add_task(
         name="multi-update",
@@ -133,12 +120,8 @@ def test_update_task_multiple_fields(test_db: Path, monkeypatch):
     assert updated.started_at is not None
 
 
-def test_update_task_add_specification_to_task_without_specification(
-    test_db: Path, monkeypatch
-):
+def test_update_task_add_specification_to_task_without_specification():
     """Test adding specification to a task that didn't have any."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create task without specification
     TaskRepository.add_task(
         name="add-details",
@@ -156,10 +139,8 @@ def test_update_task_add_specification_to_task_without_specification(
     assert updated.specification == "Newly added details"
 
 
-def test_update_task_modify_existing_specification(test_db: Path, monkeypatch):
+def test_update_task_modify_existing_specification():
     """Test modifying existing specification."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create task with specification
     TaskRepository.add_task(
         name="modify-details",
@@ -177,10 +158,8 @@ def test_update_task_modify_existing_specification(test_db: Path, monkeypatch):
     assert updated.specification == "Modified details"
 
 
-def test_update_task_clear_specification(test_db: Path, monkeypatch):
+def test_update_task_clear_specification():
     """Test clearing specification by setting to empty string."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create task with specification
     TaskRepository.add_task(
         name="clear-details",
@@ -198,10 +177,8 @@ def test_update_task_clear_specification(test_db: Path, monkeypatch):
     assert updated.specification == ""
 
 
-def test_update_task_nonexistent_task(test_db: Path, monkeypatch):
+def test_update_task_nonexistent_task():
     """Test updating a task that doesn't exist."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     result = TaskRepository.update_task(
         name="nonexistent",
         description="New description",
@@ -210,32 +187,18 @@ def test_update_task_nonexistent_task(test_db: Path, monkeypatch):
     assert result is None
 
 
-def test_update_task_empty_name(test_db: Path, monkeypatch):
-    """Test updating with empty task name raises error."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
+@pytest.mark.parametrize("bad_name", ["", "   "])
+def test_update_task_blank_name(bad_name):
+    """Test updating with an empty or whitespace-only task name raises error."""
     with pytest.raises(ValueError, match="Task name cannot be empty"):
         TaskRepository.update_task(
-            name="",
+            name=bad_name,
             description="New description",
         )
 
 
-def test_update_task_whitespace_name(test_db: Path, monkeypatch):
-    """Test updating with whitespace-only task name raises error."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
-    with pytest.raises(ValueError, match="Task name cannot be empty"):
-        TaskRepository.update_task(
-            name="   ",
-            description="New description",
-        )
-
-
-def test_update_task_no_fields_specified(test_db: Path, monkeypatch):
+def test_update_task_no_fields_specified():
     """Test updating with no fields specified returns unchanged task."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create a task
     original = TaskRepository.add_task(
         name="no-update",
@@ -252,10 +215,8 @@ def test_update_task_no_fields_specified(test_db: Path, monkeypatch):
     assert result.priority == original.priority
 
 
-def test_update_task_preserves_unspecified_fields(test_db: Path, monkeypatch):
+def test_update_task_preserves_unspecified_fields():
     """Test that unspecified fields are preserved during update."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create task with all fields
     TaskRepository.add_task(
         name="preserve-test",
@@ -278,10 +239,8 @@ def test_update_task_preserves_unspecified_fields(test_db: Path, monkeypatch):
     assert updated.specification == "Original details"  # Preserved
 
 
-def test_update_task_status_from_pending_to_completed(test_db: Path, monkeypatch):
+def test_update_task_status_from_pending_to_completed():
     """Test transitioning directly from pending to completed."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create pending task
     TaskRepository.add_task(
         name="skip-in-progress",
@@ -302,10 +261,8 @@ def test_update_task_status_from_pending_to_completed(test_db: Path, monkeypatch
     # started_at might be None since we skipped in_progress
 
 
-def test_update_task_priority_bounds(test_db: Path, monkeypatch):
+def test_update_task_priority_bounds():
     """Test updating priority to minimum and maximum values."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create task
     TaskRepository.add_task(
         name="priority-bounds",
@@ -331,10 +288,8 @@ def test_update_task_priority_bounds(test_db: Path, monkeypatch):
     assert updated_max.priority == 10
 
 
-def test_update_task_with_long_specification(test_db: Path, monkeypatch):
+def test_update_task_with_long_specification():
     """Test updating with very long specification."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create task
     TaskRepository.add_task(
         name="long-details",
@@ -355,10 +310,8 @@ def test_update_task_with_long_specification(test_db: Path, monkeypatch):
     assert len(updated.specification) == 5000
 
 
-def test_update_task_with_unicode_specification(test_db: Path, monkeypatch):
+def test_update_task_with_unicode_specification():
     """Test updating with unicode characters in specification."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create task
     TaskRepository.add_task(
         name="unicode-details",
@@ -379,10 +332,8 @@ def test_update_task_with_unicode_specification(test_db: Path, monkeypatch):
     assert "✨" in updated.specification
 
 
-def test_update_task_status_preserves_timestamps(test_db: Path, monkeypatch):
+def test_update_task_status_preserves_timestamps():
     """Test that updating status preserves existing timestamps."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create task and transition through statuses
     TaskRepository.add_task(
         name="timestamp-preserve",
@@ -407,10 +358,8 @@ def test_update_task_status_preserves_timestamps(test_db: Path, monkeypatch):
     assert completed.completed_at is not None
 
 
-def test_update_task_different_status_values(test_db: Path, monkeypatch):
+def test_update_task_different_status_values():
     """Test updating to different valid status values."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     TaskRepository.add_task(
         name="status-values",
         description="Test status values",
@@ -427,10 +376,8 @@ def test_update_task_different_status_values(test_db: Path, monkeypatch):
         assert updated.status == status
 
 
-def test_update_task_multiple_consecutive_updates(test_db: Path, monkeypatch):
+def test_update_task_multiple_consecutive_updates():
     """Test performing multiple consecutive updates on the same task."""
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-
     # Create task
     TaskRepository.add_task(
         name="consecutive-updates",
@@ -5,6 +5,7 @@ Tests for TaskTree CLI commands.
 import json
 import sqlite3
 import tempfile
+import time
 from pathlib import Path
 from typing import Generator
 from unittest.mock import patch
@@ -13,26 +14,28 @@ import pytest
 from typer.testing import CliRunner
 
 from tasktree.cli.main import cli
+from tasktree.cli.main import reset as reset_cmd
 
 # Test runner for Typer CLI
 runner = CliRunner()
 
 
 @pytest.fixture(autouse=True)
-def mock_snapshot_path():
-    """Mock get_snapshot_path to return a non-existent path by default."""
-    with patch("tasktree.cli.main.get_snapshot_path") as mock:
-        mock.return_value = Path("/non/existent/snapshot.jsonl")
-        yield mock
+def mock_snapshot_path(tmp_path: Path, monkeypatch) -> Path:
+    """Point TASKTREE_SNAPSHOT_PATH at a non-existent snapshot by default."""
+    snapshot_path = tmp_path / "missing-snapshot.jsonl"
+    monkeypatch.setenv("TASKTREE_SNAPSHOT_PATH", str(snapshot_path))
+    return snapshot_path
 
 
 @pytest.fixture(scope="function")
-def cli_test_db() -> Generator[Path, None, None]:
+def cli_test_db(monkeypatch) -> Generator[Path, None, None]:
     """
     Create a temporary test database path for CLI tests.
 
     Unlike test_db, this fixture does NOT initialize the database,
-    allowing CLI tests to test the init command themselves.
+    allowing CLI tests to test the init command themselves. The path is
+    exported via TASKTREE_DB_PATH so the CLI resolves it through get_db_path.
 
     Yields:
         Path: Path to a temporary database file (not yet created)
@@ -43,6 +46,7 @@ def cli_test_db() -> Generator[Path, None, None]:
     db_path = Path(temp_db.name)
     temp_db.close()
     db_path.unlink()  # Delete the file, we just want the path
+    monkeypatch.setenv("TASKTREE_DB_PATH", str(db_path))
 
     try:
         yield db_path
@@ -52,68 +56,74 @@ def cli_test_db() -> Generator[Path, None, None]:
             db_path.unlink()
 
 
+@pytest.fixture(scope="module")
+def help_result():
+    """
+    Invoke ``tasktree --help`` once and share the result.
+
+    The help output does not depend on the database or environment, so the
+    tests that only inspect it can reuse a single invocation.
+    """
+    return runner.invoke(cli, ["--help"])
+
+
 class TestCLIInit:
     """Test CLI init command."""
 
     def test_init_creates_database(self, cli_test_db: Path):
         """Test that init creates a new database."""
-        with patch("tasktree.cli.main.get_db_path", return_value=cli_test_db):
-            result = runner.invoke(cli, ["init"])
+        result = runner.invoke(cli, ["init"])
 
-            assert result.exit_code == 0
-            assert "Database initialized successfully!" in result.stdout
-            assert cli_test_db.exists()
+        assert result.exit_code == 0
+        assert "Database initialized successfully!" in result.stdout
+        assert cli_test_db.exists()
 
-            # Verify database has tables
-            conn = sqlite3.connect(cli_test_db)
-            cursor = conn.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = [row[0] for row in cursor.fetchall()]
-            conn.close()
+        # Verify database has tables
+        conn = sqlite3.connect(cli_test_db, isolation_level=None)
+        cursor = conn.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        tables = [row[0] for row in cursor.fetchall()]
+        conn.close()
 
-            assert "tasks" in tables
-            assert "features" in tables
-            assert "dependencies" in tables
+        assert "tasks" in tables
+        assert "features" in tables
+        assert "dependencies" in tables
 
     def test_init_force_overwrites_existing(self, cli_test_db: Path):
         """Test that init with --force overwrites existing database."""
         # Create initial database
-        with patch("tasktree.cli.main.get_db_path", return_value=cli_test_db):
-            runner.invoke(cli, ["init"])
-
-            # Verify it exists
-            assert cli_test_db.exists()
+        runner.invoke(cli, ["init"])
 
-            # Get initial modification time
-            initial_mtime = cli_test_db.stat().st_mtime
+        # Verify it exists
+        assert cli_test_db.exists()
 
-            # Sleep to ensure different timestamp
-            import time
+        # Get initial modification time
+        initial_mtime = cli_test_db.stat().st_mtime
 
-            time.sleep(0.01)
+        # Sleep to ensure different timestamp
+        time.sleep(0.01)
 
-            # Run with force
-            result = runner.invoke(cli, ["init", "--force"])
+        # Run with force
+        result = runner.invoke(cli, ["init", "--force"])
 
-            assert result.exit_code == 0
-            assert "Database initialized successfully!" in result.stdout
-            assert cli_test_db.exists()
+        assert result.exit_code == 0
+        assert "Database initialized successfully!" in result.stdout
+        assert cli_test_db.exists()
 
-            # Verify database was overwritten (newer modification time)
-            new_mtime = cli_test_db.stat().st_mtime
-            assert new_mtime > initial_mtime
+        # Verify database was overwritten (newer modification time)
+        new_mtime = cli_test_db.stat().st_mtime
+        assert new_mtime > initial_mtime
 
     def test_init_fails_on_existing_without_force(self, cli_test_db: Path):
         """Test that init fails on existing database without --force."""
         # Create initial database
-        with patch("tasktree.cli.main.get_db_path", return_value=cli_test_db):
-            runner.invoke(cli, ["init"])
+        runner.invoke(cli, ["init"])
 
-            # Try to init again without force
-            result = runner.invoke(cli, ["init"])
+        # Try to init again without force
+        result = runner.invoke(cli, ["init"])
 
-            assert result.exit_code == 1
-            assert "Database already exists" in result.output
+        assert result.exit_code == 1
+        assert "Database already exists" in result.output
 
 
 class TestCLIStart:
@@ -121,25 +131,23 @@ class TestCLIStart:
 
     def test_start_fails_on_missing_database(self, cli_test_db: Path):
         """Test that start fails when database doesn't exist."""
-        with patch("tasktree.cli.main.get_db_path", return_value=cli_test_db):
-            result = runner.invoke(cli, ["start"])
+        result = runner.invoke(cli, ["start"])
 
-            assert result.exit_code == 1
-            assert "Database not found" in result.output
+        assert result.exit_code == 1
+        assert "Database not found" in result.output
 
     def test_start_with_valid_database(self, cli_test_db: Path):
         """Test that start command works with valid database."""
         # Initialize database first
-        with patch("tasktree.cli.main.get_db_path", return_value=cli_test_db):
-            runner.invoke(cli, ["init"])
+        runner.invoke(cli, ["init"])
 
-            # Mock the server to avoid actually starting it
-            # run_server is imported inside the start function, so we patch it there
-            with patch("tasktree.graph.server.run_server") as mock_server:
-                result = runner.invoke(cli, ["start", "--port", "9999"])
+        # Mock the server to avoid actually starting it
+        # run_server is imported inside the start function, so we patch it there
+        with patch("tasktree.graph.server.run_server") as mock_server:
+            result = runner.invoke(cli, ["start", "--port", "9999"])
 
-                assert result.exit_code == 0
-                mock_server.assert_called_once_with(9999, cli_test_db)
+            assert result.exit_code == 0
+            mock_server.assert_called_once_with(9999, cli_test_db)
 
 
 class TestCLIRefreshViews:
@@ -147,23 +155,21 @@ class TestCLIRefreshViews:
 
     def test_refresh_views_fails_on_missing_database(self, cli_test_db: Path):
         """Test that refresh-views fails when database doesn't exist."""
-        with patch("tasktree.cli.main.get_db_path", return_value=cli_test_db):
-            result = runner.invoke(cli, ["refresh-views"])
+        result = runner.invoke(cli, ["refresh-views"])
 
-            assert result.exit_code == 1
-            assert "Database not found" in result.output
+        assert result.exit_code == 1
+        assert "Database not found" in result.output
 
     def test_refresh_views_success(self, cli_test_db: Path):
         """Test that refresh-views works on existing database."""
         # Initialize database first
-        with patch("tasktree.cli.main.get_db_path", return_value=cli_test_db):
-            runner.invoke(cli, ["init"])
+        runner.invoke(cli, ["init"])
 
-            # Call refresh-views
-            result = runner.invoke(cli, ["refresh-views"])
+        # Call refresh-views
+        result = runner.invoke(cli, ["refresh-views"])
 
-            assert result.exit_code == 0
-            assert "Views refreshed successfully!" in result.stdout
+        assert result.exit_code == 0
+        assert "Views refreshed successfully!" in result.stdout
 
 
 class TestCLIReset:
@@ -171,55 +177,48 @@ class TestCLIReset:
 
     def test_reset_fails_on_missing_database(self, cli_test_db: Path):
         """Test that reset fails when database doesn't exist."""
-        with patch("tasktree.cli.main.get_db_path", return_value=cli_test_db):
-            result = runner.invoke(cli, ["reset"])
+        result = runner.invoke(cli, ["reset"])
 
-            assert result.exit_code == 1
-            assert "Database not found" in result.output
+        assert result.exit_code == 1
+        assert "Database not found" in result.output
 
-    def test_reset_with_confirmation(self, cli_test_db: Path):
+    def test_reset_with_confirmation(self, cli_test_db: Path, capsys):
         """Test that reset works with user confirmation."""
         # Initialize database and add some data
-        with patch("tasktree.cli.main.get_db_path", return_value=cli_test_db):
-            runner.invoke(cli, ["init"])
-
-            # Add test data
-            conn = sqlite3.connect(cli_test_db)
-            conn.execute(
-                "INSERT INTO features (name, description, specification) VALUES (?, ?, ?)",
-                ("test-feature", "Test feature", "Test spec"),
-            )
-            conn.commit()
+        runner.invoke(cli, ["init"])
 
-            # Get the feature_id for the foreign key
-            cursor = conn.cursor()
-            cursor.execute("SELECT id FROM features WHERE name = ?", ("test-feature",))
-            feature_id = cursor.fetchone()[0]
+        # Add test data
+        conn = sqlite3.connect(cli_test_db, isolation_level=None)
+        conn.execute(
+            "INSERT INTO features (name, description, specification) VALUES (?, ?, ?)",
+            ("test-feature", "Test feature", "Test spec"),
+        )
 
-            conn.execute(
-                "INSERT INTO tasks (name, description, specification, priority, status, feature_id, tests_required) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                ("test-task", "Test task", "Test spec", 5, "pending", feature_id, True),
-            )
-            conn.commit()
+        # Get the feature_id for the foreign key
+        cursor = conn.cursor()
+        cursor.execute("SELECT id FROM features WHERE name = ?", ("test-feature",))
+        feature_id = cursor.fetchone()[0]
 
-            # Verify data exists
-            cursor.execute("SELECT COUNT(*) FROM tasks")
-            task_count = cursor.fetchone()[0]
-            conn.close()
+        conn.execute(
+            "INSERT INTO tasks (name, description, specification, priority, status, feature_id, tests_required) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            ("test-task", "Test task", "Test spec", 5, "pending", feature_id, True),
+        )
 
-            assert task_count == 1
+        # Verify data exists
+        cursor.execute("SELECT COUNT(*) FROM tasks")
+        task_count = cursor.fetchone()[0]
 
-            # Reset with confirmation
-            result = runner.invoke(cli, ["reset", "--confirm"])
+        assert task_count == 1
 
-            assert result.exit_code == 0
-            assert "Database reset successfully!" in result.stdout
+        try:
+            # Reset with confirmation, calling the command function directly since
+            # only the database side effects are under test here. The connection
+            # above is in autocommit mode, so it can stay open across the reset.
+            reset_cmd(confirm=True)
 
-            # Verify data is gone but schema remains
-            conn = sqlite3.connect(cli_test_db)
-            cursor = conn.cursor()
+            assert "Database reset successfully!" in capsys.readouterr().out
 
-            # Check tables still exist
+            # Verify data is gone but schema remains
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
             tables = [row[0] for row in cursor.fetchall()]
             assert "tasks" in tables
@@ -230,23 +229,31 @@ class TestCLIReset:
             task_count = cursor.fetchone()[0]
             cursor.execute("SELECT COUNT(*) FROM features")
             feature_count = cursor.fetchone()[0]
-
+        finally:
             conn.close()
 
-            assert task_count == 0
-            assert feature_count == 0
+        assert task_count == 0
+        assert feature_count == 0
+
+    def test_reset_confirm_flag(self, cli_test_db: Path):
+        """Test that `reset --confirm` parses and resets without prompting."""
+        runner.invoke(cli, ["init"])
+
+        result = runner.invoke(cli, ["reset", "--confirm"])
+
+        assert result.exit_code == 0
+        assert "Database reset successfully!" in result.stdout
 
     def test_reset_without_confirmation_prompts(self, cli_test_db: Path):
         """Test that reset prompts for confirmation without --confirm flag."""
         # Initialize database
-        with patch("tasktree.cli.main.get_db_path", return_value=cli_test_db):
-            runner.invoke(cli, ["init"])
+        runner.invoke(cli, ["init"])
 
-            # Try reset without confirmation (should prompt)
-            result = runner.invoke(cli, ["reset"], input="n\n")
+        # Try reset without confirmation (should prompt)
+        result = runner.invoke(cli, ["reset"], input="n\n")
 
-            assert result.exit_code == 0
-            assert "Operation cancelled" in result.stdout
+        assert result.exit_code == 0
+        assert "Operation cancelled" in result.stdout
 
 
 class TestCLIMCP:
@@ -276,9 +283,9 @@ class TestCLIMCP:
 class TestCLIGeneral:
     """Test general CLI behavior."""
 
-    def test_cli_help(self):
+    def test_cli_help(self, help_result):
         """Test that CLI shows help."""
-        result = runner.invoke(cli, ["--help"])
+        result = help_result
 
         assert result.exit_code == 0
         assert "TaskTree CLI" in result.stdout
@@ -299,7 +306,7 @@ class TestCLIGeneral:
 class TestCLIEntryPoint:
     """Test console script entry point."""
 
-    def test_console_script_entry_point(self):
+    def test_console_script_entry_point(self, help_result):
         """Test that the tasktree console script entry point is correctly configured."""
         # Test that the CLI app is importable and has the expected structure
         from tasktree.cli.main import cli
@@ -309,7 +316,7 @@ class TestCLIEntryPoint:
 
         # Verify the main commands are registered by invoking with --help
         # This is a more reliable way to test that commands are available
-        result = runner.invoke(cli, ["--help"])
+        result = help_result
         assert result.exit_code == 0
         assert "init" in result.stdout
         assert "start" in result.stdout
@@ -320,10 +327,12 @@ class TestCLIInitSnapshot:
     """Test CLI init command with snapshot integration."""
 
     @pytest.fixture(scope="function")
-    def temp_paths(self) -> Generator[tuple[Path, Path], None, None]:
+    def temp_paths(self, monkeypatch) -> Generator[tuple[Path, Path], None, None]:
         """
         Create temporary test database and snapshot paths.
 
+        Both paths are exported via TASKTREE_DB_PATH and TASKTREE_SNAPSHOT_PATH.
+
         Yields:
             tuple[Path, Path]: (db_path, snapshot_path)
         """
@@ -331,6 +340,8 @@ class TestCLIInitSnapshot:
             temp_dir_path = Path(temp_dir)
             db_path = temp_dir_path / "test.db"
             snapshot_path = temp_dir_path / "snapshot.jsonl"
+            monkeypatch.setenv("TASKTREE_DB_PATH", str(db_path))
+            monkeypatch.setenv("TASKTREE_SNAPSHOT_PATH", str(snapshot_path))
             yield db_path, snapshot_path
 
     def test_init_restores_from_snapshot(self, temp_paths: tuple[Path, Path]):
@@ -366,41 +377,41 @@ class TestCLIInitSnapshot:
             },
         ]
 
-        with snapshot_path.open("w", encoding="utf-8") as f:
-            for record in snapshot_data:
-                f.write(json.dumps(record) + "\n")
-
-        with (
-            patch("tasktree.cli.main.get_db_path", return_value=db_path),
-            patch("tasktree.cli.main.get_snapshot_path", return_value=snapshot_path),
-        ):
-            result = runner.invoke(cli, ["init"])
+        snapshot_path.write_text(
+            "\n".join(
+                json.dumps(record, separators=(",", ":")) for record in snapshot_data
+            )
+            + "\n",
+            encoding="utf-8",
+        )
 
-            assert result.exit_code == 0
-            assert "Database initialized successfully!" in result.stdout
-            assert f"Restoring database from snapshot: {snapshot_path}" in result.stdout
-            assert "✓ Database restored from snapshot." in result.stdout
-            assert db_path.exists()
-
-            # Verify database contains records from snapshot
-            conn = sqlite3.connect(db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            cursor.execute("SELECT name, description FROM features")
-            features = cursor.fetchall()
-            feature_names = [f["name"] for f in features]
-            assert "feat1" in feature_names
-            assert "misc" in feature_names
-            assert len(features) == 2
-
-            cursor.execute("SELECT name, description, priority FROM tasks")
-            tasks = cursor.fetchall()
-            assert len(tasks) == 1
-            assert tasks[0]["name"] == "task1"
-            assert tasks[0]["priority"] == 5
+        result = runner.invoke(cli, ["init"])
 
-            conn.close()
+        assert result.exit_code == 0
+        assert "Database initialized successfully!" in result.stdout
+        assert f"Restoring database from snapshot: {snapshot_path}" in result.stdout
+        assert "✓ Database restored from snapshot." in result.stdout
+        assert db_path.exists()
+
+        # Verify database contains records from snapshot
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT name, description FROM features")
+        features = cursor.fetchall()
+        feature_names = [f["name"] for f in features]
+        assert "feat1" in feature_names
+        assert "misc" in feature_names
+        assert len(features) == 2
+
+        cursor.execute("SELECT name, description, priority FROM tasks")
+        tasks = cursor.fetchall()
+        assert len(tasks) == 1
+        assert tasks[0]["name"] == "task1"
+        assert tasks[0]["priority"] == 5
+
+        conn.close()
 
     def test_init_works_without_snapshot(self, temp_paths: tuple[Path, Path]):
         """Test that init works fine if no snapshot exists."""
@@ -408,20 +419,16 @@ class TestCLIInitSnapshot:
         # Ensure snapshot path does NOT exist
         assert not snapshot_path.exists()
 
-        with (
-            patch("tasktree.cli.main.get_db_path", return_value=db_path),
-            patch("tasktree.cli.main.get_snapshot_path", return_value=snapshot_path),
-        ):
-            result = runner.invoke(cli, ["init"])
+        result = runner.invoke(cli, ["init"])
 
-            assert result.exit_code == 0
-            assert "Database initialized successfully!" in result.stdout
-            assert "Restoring database from snapshot" not in result.stdout
-            assert db_path.exists()
-
-            # Verify database is empty but schema exists
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM tasks")
-            assert cursor.fetchone()[0] == 0
-            conn.close()
+        assert result.exit_code == 0
+        assert "Database initialized successfully!" in result.stdout
+        assert "Restoring database from snapshot" not in result.stdout
+        assert db_path.exists()
+
+        # Verify database is empty but schema exists
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM tasks")
+        assert cursor.fetchone()[0] == 0
+        conn.close()
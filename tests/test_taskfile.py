@@ -3,8 +3,11 @@ Tests for Taskfile.yml content.
 """
 
 from pathlib import Path
+import pytest
 import yaml
 
+pytestmark = pytest.mark.no_db
+
 
 def test_taskfile_mcp_command():
     """Verify that the mcp task in Taskfile.yml uses the tasktree CLI."""
@@ -8,6 +8,8 @@ import pytest
 
 from tasktree.core.paths import find_repo_root, get_db_path, get_snapshot_path
 
+pytestmark = pytest.mark.no_db
+
 
 class TestFindRepoRoot:
     """Tests for find_repo_root function."""